@@ -40,6 +40,7 @@ class ConsolidateRequest(BaseModel):
     memory_type: str | None = None
     min_cluster_size: int = Field(default=2, ge=2)
     dry_run: bool = False
+    include_merged: bool = False  # Embed merged memory fields in each result
 
 
 class ConsolidateResponse(BaseModel):
@@ -50,6 +51,7 @@ class ConsolidateResponse(BaseModel):
 
 class DecayRequest(BaseModel):
     simulate_hours: float = Field(default=0.0, ge=0.0)
+    domain: str | None = None
 
 
 class DecayResponse(BaseModel):
@@ -87,15 +89,28 @@ async def trigger_consolidation(request: Request, body: ConsolidateRequest):
         memories_merged = 0
         for r in results:
             memories_merged += len(r.source_memories)
-            formatted.append(
-                {
-                    "merged_id": r.merged_memory.id,
-                    "source_ids": r.source_memories,
-                    "content_preview": r.merged_memory.content[:100],
-                    "relationships_created": r.relationships_created,
-                    "memories_superseded": r.memories_superseded,
+            entry = {
+                "merged_id": r.merged_memory.id,
+                "source_ids": r.source_memories,
+                "content_preview": r.merged_memory.content[:100],
+                "relationships_created": r.relationships_created,
+                "memories_superseded": r.memories_superseded,
+            }
+            if body.include_merged:
+                # Saves callers a GET /memory/{merged_id} round-trip
+                merged = r.merged_memory
+                entry["merged"] = {
+                    "id": merged.id,
+                    "content": merged.content,
+                    "memory_type": merged.memory_type.value,
+                    "domain": merged.domain,
+                    "tags": merged.tags,
+                    "importance": merged.importance,
+                    "stability": merged.stability,
+                    "confidence": merged.confidence,
+                    "durability": merged.durability.value if merged.durability else None,
                 }
-            )
+            formatted.append(entry)
 
         return ConsolidateResponse(
             clusters_merged=len(results),
@@ -117,7 +132,8 @@ async def trigger_decay(request: Request, body: DecayRequest):
         neo4j = await get_neo4j_store()
 
         worker = DecayWorker(qdrant, neo4j)
-        stats = await worker.run(hours_offset=body.simulate_hours)
+        domain = normalize_domain(body.domain) if body.domain else None
+        stats = await worker.run(hours_offset=body.simulate_hours, domain=domain)
 
         return DecayResponse(**stats)
 
@@ -322,6 +338,7 @@ def classify_durability(payload: dict[str, Any]) -> tuple[str, str]:
 
 class MigrateDurabilityRequest(BaseModel):
     dry_run: bool = True
+    domain: str | None = None
 
 
 class MigrationSampleEntry(BaseModel):
@@ -346,14 +363,15 @@ async def migrate_durability(request: Request, body: MigrateDurabilityRequest):
     Classify and backfill durability for pre-v2.2 memories (null durability).
 
     Naturally idempotent — only targets memories with null durability.
-    Default dry_run=true for safety.
+    Default dry_run=true for safety. Optional domain limits the scan.
     """
     try:
         qdrant = await get_qdrant_store()
         neo4j = await get_neo4j_store()
         pg = await get_postgres_store()
 
-        null_memories = await qdrant.scroll_null_durability()
+        domain = normalize_domain(body.domain) if body.domain else None
+        null_memories = await qdrant.scroll_null_durability(domain=domain)
         total_null = len(null_memories)
 
         per_tier: dict[str, int] = {"ephemeral": 0, "durable": 0, "permanent": 0}
@@ -5,10 +5,12 @@ Provides system health overview, per-memory force profiles,
 and conflict detection.
 """
 
+import asyncio
+import hashlib
 import json
 
 import structlog
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from src.api.rate_limit import limiter
 from src.core.health import create_health_computer
@@ -20,6 +22,9 @@ router = APIRouter()
 DASHBOARD_CACHE_KEY = "recall:health:dashboard"
 DASHBOARD_CACHE_TTL = 300  # 5 minutes
 
+# Serialises cold-cache recomputes so concurrent requests share one result
+_dashboard_lock = asyncio.Lock()
+
 CONFLICTS_CACHE_KEY = "recall:conflicts"
 CONFLICTS_CACHE_TTL = 600  # 10 minutes
 
@@ -32,27 +37,35 @@ async def get_health_dashboard(request: Request):
 
     Returns feedback metrics, population balance, graph cohesion,
     pin ratio, importance distribution, and feedback similarity.
-    Cached for 5 minutes.
+    Cached for 5 minutes; honours If-None-Match with a 304.
     """
     try:
         redis = await get_redis_store()
 
         # Check cache
         cached = await redis.client.get(DASHBOARD_CACHE_KEY)
-        if cached:
-            return json.loads(cached)
-
-        computer = await create_health_computer()
-        dashboard = await computer.compute_dashboard()
-
-        # Cache result
-        await redis.client.setex(
-            DASHBOARD_CACHE_KEY,
-            DASHBOARD_CACHE_TTL,
-            json.dumps(dashboard, default=str),
-        )
-
-        return dashboard
+        if not cached:
+            async with _dashboard_lock:
+                # Another request may have filled the cache while we waited
+                cached = await redis.client.get(DASHBOARD_CACHE_KEY)
+                if not cached:
+                    computer = await create_health_computer()
+                    dashboard = await computer.compute_dashboard()
+                    cached = json.dumps(dashboard, default=str)
+
+                    # Cache result
+                    await redis.client.setex(
+                        DASHBOARD_CACHE_KEY,
+                        DASHBOARD_CACHE_TTL,
+                        cached,
+                    )
+
+        # The cached JSON is served as-is; its hash doubles as the ETag so
+        # clients holding the same snapshot get a bodiless 304
+        etag = f'"{hashlib.sha1(cached.encode()).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
 
     except Exception as e:
         logger.error("health_dashboard_error", error=str(e))
@@ -20,7 +20,7 @@ from src.core import (
     get_embedding_service,
 )
 from src.core.domains import normalize_domain
-from src.core.embeddings import OllamaUnavailableError, content_hash
+from src.core.embeddings import EmbeddingError, OllamaUnavailableError, content_hash
 from src.storage import get_neo4j_store, get_postgres_store, get_qdrant_store, get_redis_store
 
 logger = structlog.get_logger()
@@ -56,6 +56,22 @@ class StoreMemoryResponse(BaseModel):
     message: str
     durability: str | None = None
     initial_importance: float | None = None
+    # Values as stored (after defaults), so callers needn't re-GET; on a
+    # dedup hit they describe the existing memory, not the request
+    memory_type: str | None = None
+    importance: float | None = None
+    confidence: float | None = None
+
+
+def _stored_fields(payload: dict[str, Any]) -> dict[str, Any]:
+    """StoreMemoryResponse fields taken from an existing memory's Qdrant payload."""
+    return {
+        "durability": payload.get("durability"),
+        "initial_importance": payload.get("initial_importance"),
+        "memory_type": payload.get("memory_type"),
+        "importance": payload.get("importance"),
+        "confidence": payload.get("confidence"),
+    }
 
 
 class MemoryResponse(BaseModel):
@@ -141,13 +157,13 @@ async def store_memory(
             if request.session_id:
                 redis = await get_redis_store()
                 await redis.add_to_working_memory(request.session_id, existing_id)
+            existing_payload = await qdrant.get_payload(existing_id)
             return StoreMemoryResponse(
                 id=existing_id,
                 content_hash=memory.content_hash,
                 created=False,
                 message="Duplicate memory — identical content already stored",
-                durability=request.durability,
-                initial_importance=request.importance,
+                **_stored_fields(existing_payload or {}),
             )
 
         # Generate embedding
@@ -161,9 +177,8 @@ async def store_memory(
             include_superseded=False,
         )
         if similar:
-            _, sim_score, _ = similar[0]
+            existing_id, sim_score, existing_payload = similar[0]
             if sim_score > 0.95:
-                existing_id = similar[0][0]
                 # Still track in working memory for session continuity
                 if request.session_id:
                     redis = await get_redis_store()
@@ -173,8 +188,7 @@ async def store_memory(
                     content_hash=memory.content_hash,
                     created=False,
                     message="Near-duplicate memory — semantically identical content already stored",
-                    durability=request.durability,
-                    initial_importance=request.importance,
+                    **_stored_fields(existing_payload),
                 )
 
         # Store in Qdrant
@@ -237,6 +251,9 @@ async def store_memory(
             message="Memory stored successfully",
             durability=request.durability,
             initial_importance=memory.initial_importance,
+            memory_type=memory.memory_type.value,
+            importance=memory.importance,
+            confidence=memory.confidence,
         )
 
     except OllamaUnavailableError:
@@ -445,6 +462,8 @@ class FeedbackResponse(BaseModel):
     not_useful: int
     not_found: int
     relationships_strengthened: int = 0
+    # Post-feedback importance per processed memory, so callers needn't re-GET
+    importance: dict[str, float] = {}
 
 
 @router.post("/feedback", response_model=FeedbackResponse)
@@ -470,6 +489,7 @@ async def submit_feedback(request: FeedbackRequest, user: User | None = Depends(
         not_useful = 0
         not_found = 0
         useful_memory_ids: list[str] = []
+        new_importances: dict[str, float] = {}
 
         for memory_id in request.injected_ids:
             result = await qdrant.get(memory_id)
@@ -498,6 +518,8 @@ async def submit_feedback(request: FeedbackRequest, user: User | None = Depends(
                 not_useful += 1
                 is_useful = False
 
+            new_importances[memory_id] = new_importance
+
             # Update Qdrant
             await qdrant.update_importance(memory_id, new_importance)
             await qdrant.update_stability(memory_id, new_stability)
@@ -557,6 +579,7 @@ async def submit_feedback(request: FeedbackRequest, user: User | None = Depends(
             not_useful=not_useful,
             not_found=not_found,
             relationships_strengthened=relationships_strengthened,
+            importance=new_importances,
         )
 
     except OllamaUnavailableError:
@@ -649,9 +672,9 @@ async def get_force_profile(memory_id: str):
 # =============================================================
 
 
-@router.get("/{memory_id}", response_model=MemoryResponse)
+@router.api_route("/{memory_id}", methods=["GET", "HEAD"], response_model=MemoryResponse)
 async def get_memory(memory_id: str):
-    """Get a memory by ID."""
+    """Get a memory by ID. HEAD gives a body-less existence check."""
     try:
         qdrant = await get_qdrant_store()
         result = await qdrant.get(memory_id)
@@ -909,6 +932,18 @@ async def batch_store_memories(
         embedding_service = await get_embedding_service()
         pg = await get_postgres_store()
 
+        # Embed every item in one Ollama call; per-batch throughput is far
+        # higher than per-item. Fall back to per-item embeds on failure so one
+        # bad input only errors its own item.
+        contents = [item.content for item in request.memories]
+        try:
+            vectors = dict(zip(contents, await embedding_service.embed_batch(contents)))
+        except OllamaUnavailableError:
+            raise
+        except EmbeddingError as e:
+            logger.warning("batch_embed_failed_falling_back", error=str(e))
+            vectors = {}
+
         results = []
         created = 0
         duplicates = 0
@@ -950,8 +985,10 @@ async def batch_store_memories(
                     duplicates += 1
                     continue
 
-                # Embed
-                embedding = await embedding_service.embed(item.content)
+                # Embed (already done in the batch call unless it failed)
+                embedding = vectors.get(item.content)
+                if embedding is None:
+                    embedding = await embedding_service.embed(item.content)
 
                 # Store in Qdrant
                 await qdrant.store(memory, embedding)
@@ -396,8 +396,9 @@ async def get_audit_log(
 async def get_session_history(
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    session_id: str | None = Query(default=None),
 ):
-    """Get archived session history."""
+    """Get archived session history, optionally filtered to one session."""
     pg = await get_postgres_store()
-    sessions = await pg.get_session_history(limit=limit, offset=offset)
+    sessions = await pg.get_session_history(limit=limit, offset=offset, session_id=session_id)
     return {"sessions": sessions, "count": len(sessions)}
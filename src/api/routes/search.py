@@ -5,12 +5,12 @@ Search and retrieval routes.
 from datetime import datetime
 
 import structlog
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
 from src.api.rate_limit import limiter
 from src.core import MemoryQuery, MemoryType
-from src.core.embeddings import OllamaUnavailableError
+from src.core.embeddings import OllamaUnavailableError, is_embed_cached
 from src.core.retrieval import get_retrieval_pipeline
 
 logger = structlog.get_logger()
@@ -39,6 +39,7 @@ class SearchRequest(BaseModel):
     since: datetime | None = None
     until: datetime | None = None
     user: str | None = None  # Filter by username
+    wait_for_tracking: bool = False  # Respond only after access tracking is written
 
 
 class SearchResult(BaseModel):
@@ -490,7 +491,7 @@ async def rehydrate_context(request: Request, body: RehydrateRequest):
 
 @router.post("/query", response_model=SearchResponse)
 @limiter.limit("30/minute")
-async def search_memories(request: Request, body: SearchRequest):
+async def search_memories(request: Request, response: Response, body: SearchRequest):
     """
     Search for relevant memories.
 
@@ -499,6 +500,9 @@ async def search_memories(request: Request, body: SearchRequest):
     2. Graph expansion
     3. Context filtering
     4. Ranking
+
+    Sets ``X-Cache: hit|miss`` depending on whether the query embedding
+    was served from the embedding cache.
     """
     try:
         from src.core.domains import normalize_domain
@@ -524,8 +528,10 @@ async def search_memories(request: Request, body: SearchRequest):
         )
 
         # Execute retrieval
+        cache_state = "hit" if is_embed_cached(body.query, prefix="query") else "miss"
+        response.headers["X-Cache"] = cache_state
         pipeline = await get_retrieval_pipeline()
-        results = await pipeline.retrieve(query)
+        results = await pipeline.retrieve(query, wait_for_tracking=body.wait_for_tracking)
 
         # Format response
         search_results = [
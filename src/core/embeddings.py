@@ -28,6 +28,27 @@ def clear_embed_cache() -> None:
     _embed_cache.clear()
 
 
+def _embed_cache_key(text: str, prefix: str) -> str:
+    return hashlib.md5((prefix + ":" + text).encode()).hexdigest()
+
+
+def _apply_prefix(text: str, prefix: str) -> str:
+    """Qwen3-Embedding uses an instruction prefix for queries."""
+    if prefix == "query":
+        return (
+            "Instruct: Given a web search query, retrieve relevant "
+            "passages that answer the query\n"
+            f"Query:{text}"
+        )
+    return text
+
+
+def is_embed_cached(text: str, prefix: str = "passage") -> bool:
+    """Return True if a live (unexpired) cache entry exists for text/prefix."""
+    cached = _embed_cache.get(_embed_cache_key(text, prefix))
+    return cached is not None and time.time() - cached[1] < _EMBED_CACHE_TTL
+
+
 class EmbeddingService:
     """
     Generate embeddings via Ollama.
@@ -92,7 +113,7 @@ class EmbeddingService:
             1024-dimensional embedding vector
         """
         # Check LRU cache
-        cache_key = hashlib.md5((prefix + ":" + text).encode()).hexdigest()
+        cache_key = _embed_cache_key(text, prefix)
         cached = _embed_cache.get(cache_key)
         if cached is not None:
             vec, ts = cached
@@ -102,15 +123,7 @@ class EmbeddingService:
             else:
                 del _embed_cache[cache_key]
 
-        # Qwen3-Embedding uses instruction prefix for queries
-        if prefix == "query":
-            prefixed_text = (
-                "Instruct: Given a web search query, retrieve relevant "
-                "passages that answer the query\n"
-                f"Query:{text}"
-            )
-        else:
-            prefixed_text = text
+        prefixed_text = _apply_prefix(text, prefix)
 
         metrics = get_metrics()
         start = time.time()
@@ -162,6 +175,71 @@ class EmbeddingService:
                 value=time.time() - start,
             )
 
+    async def embed_batch(self, texts: list[str], prefix: str = "passage") -> list[list[float]]:
+        """
+        Generate embeddings for several texts in one Ollama call.
+
+        Cached texts are served from the LRU; only the misses are sent, as a
+        single /api/embed request with a list input.
+
+        Returns:
+            One vector per input text, in input order
+        """
+        vectors: dict[str, list[float]] = {}
+        misses: list[str] = []
+        now = time.time()
+        for text in dict.fromkeys(texts):
+            cache_key = _embed_cache_key(text, prefix)
+            cached = _embed_cache.get(cache_key)
+            if cached is not None and now - cached[1] < _EMBED_CACHE_TTL:
+                _embed_cache.move_to_end(cache_key)
+                vectors[text] = cached[0]
+            else:
+                misses.append(text)
+
+        if misses:
+            metrics = get_metrics()
+            start = time.time()
+            try:
+                response = await self.client.post(
+                    f"{self.settings.ollama_host}/api/embed",
+                    json={
+                        "model": self.settings.embedding_model,
+                        "input": [_apply_prefix(text, prefix) for text in misses],
+                    },
+                )
+            except httpx.RequestError as e:
+                logger.error("embedding_request_error", error=str(e))
+                metrics.increment("recall_embedding_requests_total", {"status": "error"})
+                raise OllamaUnavailableError(f"Failed to connect to Ollama: {e}")
+            finally:
+                metrics.observe(
+                    "recall_embedding_latency_seconds",
+                    value=time.time() - start,
+                )
+
+            if response.status_code != 200:
+                logger.error("embedding_request_failed", status=response.status_code)
+                metrics.increment("recall_embedding_requests_total", {"status": "error"})
+                raise EmbeddingError(f"Ollama returned status {response.status_code}")
+
+            embeddings = response.json().get("embeddings", [])
+            if len(embeddings) != len(misses):
+                metrics.increment("recall_embedding_requests_total", {"status": "error"})
+                raise EmbeddingError(
+                    f"Ollama returned {len(embeddings)} embeddings for {len(misses)} inputs"
+                )
+
+            for text, embedding in zip(misses, embeddings):
+                vectors[text] = embedding
+                _embed_cache[_embed_cache_key(text, prefix)] = (embedding, time.time())
+                if len(_embed_cache) > _EMBED_CACHE_MAX:
+                    _embed_cache.popitem(last=False)
+
+            metrics.increment("recall_embedding_requests_total", {"status": "success"})
+
+        return [vectors[text] for text in texts]
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
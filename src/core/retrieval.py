@@ -51,6 +51,7 @@ class RetrievalPipeline:
         self,
         query: MemoryQuery,
         browse_mode: bool = False,
+        wait_for_tracking: bool = False,
     ) -> list[RetrievalResult]:
         """
         Execute the full retrieval pipeline.
@@ -58,6 +59,8 @@ class RetrievalPipeline:
         Args:
             query: The memory query to execute.
             browse_mode: If True, skip _track_access (for lightweight browsing).
+            wait_for_tracking: If True, await _track_access before returning
+                instead of firing it in the background.
 
         Returns memories ranked by relevance.
         """
@@ -143,7 +146,10 @@ class RetrievalPipeline:
         # Stage 6: Track access (fire-and-forget, skip in browse mode)
         final = ranked[: query.limit]
         if not browse_mode and final:
-            asyncio.create_task(self._track_access(final))
+            if wait_for_tracking:
+                await self._track_access(final)
+            else:
+                asyncio.create_task(self._track_access(final))
 
         return final
 
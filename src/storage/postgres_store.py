@@ -321,16 +321,28 @@ class PostgresStore:
         self,
         limit: int = 50,
         offset: int = 0,
+        session_id: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Get archived sessions, most recent first."""
+        """Get archived sessions, most recent first, optionally for one session."""
+        params: list[Any] = []
+        idx = 1
+
+        where = ""
+        if session_id is not None:
+            where = f"WHERE session_id = ${idx}"
+            params.append(session_id)
+            idx += 1
+
+        params.extend([limit, offset])
+
         rows = await self.pool.fetch(
-            """
+            f"""
             SELECT * FROM session_archive
+            {where}
             ORDER BY started_at DESC
-            LIMIT $1 OFFSET $2
+            LIMIT ${idx} OFFSET ${idx + 1}
             """,
-            limit,
-            offset,
+            *params,
         )
         return [
             {
@@ -252,6 +252,18 @@ class QdrantStore:
             return point.vector, point.payload
         return None
 
+    async def get_payload(self, memory_id: str) -> dict[str, Any] | None:
+        """Get a memory's payload by ID, without fetching its vector."""
+        results = await self.client.retrieve(
+            collection_name=self.collection,
+            ids=[memory_id],
+            with_vectors=False,
+            with_payload=True,
+        )
+        if results:
+            return results[0].payload
+        return None
+
     async def find_by_content_hash(self, hash_value: str) -> str | None:
         """Find a memory by content_hash. Returns memory_id or None."""
         results, _ = await self.client.scroll(
@@ -420,19 +432,22 @@ class QdrantStore:
     async def scroll_null_durability(
         self,
         batch_size: int = 100,
+        domain: str | None = None,
     ) -> list[tuple[str, dict[str, Any]]]:
         """
         Scroll all non-superseded memories where durability is null.
 
         Used by the migration endpoint to find pre-v2.2 memories
-        that need durability classification.
+        that need durability classification. ``domain`` restricts the
+        scan to one domain.
         """
-        scroll_filter = Filter(
-            must=[
-                IsNullCondition(is_null=PayloadField(key="durability")),
-                IsNullCondition(is_null=PayloadField(key="superseded_by")),
-            ]
-        )
+        conditions = [
+            IsNullCondition(is_null=PayloadField(key="durability")),
+            IsNullCondition(is_null=PayloadField(key="superseded_by")),
+        ]
+        if domain:
+            conditions.append(FieldCondition(key="domain", match=MatchValue(value=domain)))
+        scroll_filter = Filter(must=conditions)
         all_points = []
         offset = None
 
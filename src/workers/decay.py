@@ -43,6 +43,7 @@ class DecayWorker:
         self,
         hours_offset: float = 0.0,
         feedback_stats: dict[str, dict[str, int]] | None = None,
+        domain: str | None = None,
     ) -> dict[str, Any]:
         """
         Run decay on all memories.
@@ -51,6 +52,7 @@ class DecayWorker:
             hours_offset: Extra hours to simulate time passing.
             feedback_stats: Pre-loaded per-memory feedback counts.
                 If None, attempts to load from Postgres.
+            domain: If set, only memories in this domain are decayed.
 
         Returns statistics about the decay run.
         """
@@ -69,6 +71,8 @@ class DecayWorker:
         results = await self.qdrant.scroll_all(
             include_superseded=False,
         )
+        if domain:
+            results = [(mid, p) for mid, p in results if p.get("domain") == domain]
         logger.debug("decay_scroll_done", count=len(results))
 
         now = datetime.utcnow()
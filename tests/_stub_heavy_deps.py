@@ -0,0 +1,53 @@
+"""
+Lightweight stand-ins for heavy storage/runtime drivers in smoke tests.
+
+Importing this module registers a lazy stub for each driver that is not
+already loaded. Stubs are plain modules; an attribute is only materialised
+as a MagicMock the first time something imports it, so unused names cost
+nothing. slowapi is always replaced because its Limiter decorator is
+actually invoked at route-definition time.
+"""
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+_STUBBED_MODULES = (
+    "neo4j",
+    "asyncpg",
+    "qdrant_client",
+    "qdrant_client.models",
+    "qdrant_client.http",
+    "qdrant_client.http.models",
+    "redis",
+    "redis.asyncio",
+    "slowapi.errors",
+    "slowapi.util",
+    "sse_starlette",
+    "sse_starlette.sse",
+    "httpx",
+    "arq",
+    "arq.connections",
+)
+
+
+class _LazyStubModule(types.ModuleType):
+    """Module whose missing attributes become cached MagicMocks on first access."""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = MagicMock(name=f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+
+for _name in _STUBBED_MODULES:
+    _module = sys.modules.setdefault(_name, _LazyStubModule(_name))
+    _parent, _, _child = _name.rpartition(".")
+    if _parent and isinstance(sys.modules.get(_parent), _LazyStubModule):
+        setattr(sys.modules[_parent], _child, _module)
+
+_slowapi_mock = MagicMock()
+_slowapi_mock.Limiter.return_value.limit.return_value = lambda f: f
+sys.modules["slowapi"] = _slowapi_mock
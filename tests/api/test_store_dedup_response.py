@@ -0,0 +1,69 @@
+"""
+Tests for the /memory/store response on dedup hits.
+
+Verifies that exact and near-duplicate responses describe the existing
+memory (from its Qdrant payload), not the values in the incoming request.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import tests._stub_heavy_deps  # noqa: F401  (must precede src imports)
+from src.api.routes.memory import StoreMemoryRequest, store_memory
+
+_EXISTING_PAYLOAD = {
+    "memory_type": "procedural",
+    "importance": 0.9,
+    "confidence": 0.6,
+    "durability": "permanent",
+    "initial_importance": 0.9,
+}
+
+
+def _request():
+    # Deliberately different from _EXISTING_PAYLOAD in every echoed field
+    return StoreMemoryRequest(
+        content="dedup echo test", importance=0.3, confidence=0.8, durability="ephemeral"
+    )
+
+
+def _assert_echoes_existing(resp):
+    assert resp.created is False
+    assert resp.id == "existing-id"
+    for field, value in _EXISTING_PAYLOAD.items():
+        assert getattr(resp, field) == value, field
+
+
+async def _store(qdrant, embed_svc=None):
+    with (
+        patch("src.api.routes.memory.get_qdrant_store", AsyncMock(return_value=qdrant)),
+        patch(
+            "src.api.routes.memory.get_embedding_service",
+            AsyncMock(return_value=embed_svc or AsyncMock()),
+        ),
+    ):
+        return await store_memory(_request(), MagicMock(), user=None)
+
+
+async def test_exact_duplicate_echoes_existing_memory():
+    qdrant = AsyncMock()
+    qdrant.find_by_content_hash = AsyncMock(return_value="existing-id")
+    qdrant.get_payload = AsyncMock(return_value=dict(_EXISTING_PAYLOAD))
+
+    resp = await _store(qdrant)
+
+    _assert_echoes_existing(resp)
+    qdrant.get_payload.assert_awaited_once_with("existing-id")
+    qdrant.get.assert_not_awaited()
+
+
+async def test_near_duplicate_echoes_existing_memory():
+    qdrant = AsyncMock()
+    qdrant.find_by_content_hash = AsyncMock(return_value=None)
+    qdrant.search = AsyncMock(return_value=[("existing-id", 0.99, dict(_EXISTING_PAYLOAD))])
+    embed_svc = AsyncMock()
+    embed_svc.embed = AsyncMock(return_value=[0.1])
+
+    resp = await _store(qdrant, embed_svc)
+
+    _assert_echoes_existing(resp)
+    qdrant.store.assert_not_awaited()
@@ -41,3 +41,19 @@ def test_stale_endpoints_exist():
 
     assert callable(list_stale_memories)
     assert callable(resolve_stale_memory)
+
+
+def test_consolidate_request_include_merged_defaults_off():
+    """include_merged is opt-in so existing consolidate callers see no change."""
+    from src.api.routes.admin import ConsolidateRequest
+
+    assert ConsolidateRequest().include_merged is False
+    assert ConsolidateRequest(include_merged=True).include_merged is True
+
+
+def test_migrate_durability_request_domain_defaults_to_all():
+    """Omitting domain keeps the original whole-collection migration scan."""
+    from src.api.routes.admin import MigrateDurabilityRequest
+
+    assert MigrateDurabilityRequest().domain is None
+    assert MigrateDurabilityRequest(domain="infra").domain == "infra"
@@ -13,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.core.embeddings import EmbeddingService
+from src.core.embeddings import EmbeddingError, EmbeddingService
 
 
 def _make_service():
@@ -164,3 +164,52 @@ class TestEmbeddingCache:
 
         finally:
             emb_mod._EMBED_CACHE_MAX = old_max
+
+    @pytest.mark.asyncio
+    async def test_is_embed_cached_tracks_prefix_and_ttl(self):
+        """is_embed_cached reports live entries only, keyed by prefix."""
+        import src.core.embeddings as emb_mod
+
+        service = _make_service()
+        _mock_ollama_response(service)
+
+        assert not emb_mod.is_embed_cached("probe", prefix="query")
+        with patch("src.core.embeddings.get_metrics", return_value=MagicMock()):
+            await service.embed("probe", prefix="query")
+        assert emb_mod.is_embed_cached("probe", prefix="query")
+        assert not emb_mod.is_embed_cached("probe", prefix="passage")
+
+        for key in emb_mod._embed_cache:
+            vec, ts = emb_mod._embed_cache[key]
+            emb_mod._embed_cache[key] = (vec, ts - emb_mod._EMBED_CACHE_TTL - 1)
+        assert not emb_mod.is_embed_cached("probe", prefix="query")
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_sends_only_misses_in_one_call(self):
+        """embed_batch serves cached texts and embeds the rest in one request."""
+        service = _make_service()
+        _mock_ollama_response(service, [1.0, 1.0, 1.0, 1.0])
+
+        with patch("src.core.embeddings.get_metrics", return_value=MagicMock()):
+            await service.embed("cached")
+
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"embeddings": [[2.0] * 4, [3.0] * 4]}
+            service.client.post = AsyncMock(return_value=response)
+
+            vectors = await service.embed_batch(["new-a", "cached", "new-b", "new-a"])
+
+        assert vectors == [[2.0] * 4, [1.0] * 4, [3.0] * 4, [2.0] * 4]
+        service.client.post.assert_awaited_once()
+        assert service.client.post.call_args.kwargs["json"]["input"] == ["new-a", "new-b"]
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_count_mismatch_raises(self):
+        """A short embeddings array from Ollama is an EmbeddingError, not a silent gap."""
+        service = _make_service()
+        _mock_ollama_response(service)
+
+        with patch("src.core.embeddings.get_metrics", return_value=MagicMock()):
+            with pytest.raises(EmbeddingError):
+                await service.embed_batch(["one", "two"])
@@ -25,6 +25,7 @@ for mod in [
 ]:
     sys.modules.setdefault(mod, MagicMock())
 
+import tests._stub_heavy_deps  # noqa: E402, F401  — no-op slowapi for the route test
 from src.core.health import HealthComputer  # noqa: E402
 
 
@@ -122,3 +123,59 @@ class TestDashboardParallel:
 
         assert result["feedback"] == expected_feedback
         assert result["population"] == expected_population
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_dashboard_requests_compute_once():
+    """Concurrent requests on a cold cache share one compute_dashboard() run."""
+    from src.api.routes import health_dashboard as route
+
+    cache: dict[str, str] = {}
+
+    async def fake_get(key):
+        return cache.get(key)
+
+    async def fake_setex(key, ttl, value):
+        cache[key] = value
+
+    redis = MagicMock()
+    redis.client.get = AsyncMock(side_effect=fake_get)
+    redis.client.setex = AsyncMock(side_effect=fake_setex)
+
+    async def slow_compute():
+        await asyncio.sleep(0.01)
+        return {"generated_at": "2026-01-01T00:00:00"}
+
+    computer = MagicMock()
+    computer.compute_dashboard = AsyncMock(side_effect=slow_compute)
+
+    with (
+        patch.object(route, "get_redis_store", AsyncMock(return_value=redis)),
+        patch.object(route, "create_health_computer", AsyncMock(return_value=computer)),
+    ):
+        r1, r2 = await asyncio.gather(
+            route.get_health_dashboard(MagicMock()),
+            route.get_health_dashboard(MagicMock()),
+        )
+
+    assert computer.compute_dashboard.await_count == 1
+    assert r1.body == r2.body
+    assert r1.headers["ETag"] == r2.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_if_none_match_returns_304():
+    """A request carrying the current ETag gets a bodiless 304."""
+    from src.api.routes import health_dashboard as route
+
+    redis = MagicMock()
+    redis.client.get = AsyncMock(return_value='{"generated_at": "2026-01-01T00:00:00"}')
+
+    with patch.object(route, "get_redis_store", AsyncMock(return_value=redis)):
+        first = await route.get_health_dashboard(MagicMock(headers={}))
+        etag = first.headers["ETag"]
+        again = await route.get_health_dashboard(MagicMock(headers={"if-none-match": etag}))
+
+    assert first.status_code == 200
+    assert again.status_code == 304
+    assert again.body == b""
@@ -4,6 +4,7 @@ Tests for _track_access background task and browse_mode behavior.
 Verifies:
 - browse_mode=True skips _track_access entirely
 - Normal mode fires _track_access as a background task (non-blocking)
+- wait_for_tracking=True awaits _track_access before returning
 """
 
 import asyncio
@@ -155,3 +156,19 @@ class TestTrackAccessBackground:
 
         await asyncio.wait_for(track_called.wait(), timeout=1.0)
         assert track_called.is_set()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_tracking_awaits_before_return(self):
+        """wait_for_tracking=True should finish the access writes inline."""
+        pipeline, qdrant, neo4j = self._setup_pipeline_mocks()
+
+        embed_mock = AsyncMock(return_value=[0.1] * 384)
+        with patch(
+            "src.core.retrieval.get_embedding_service",
+            return_value=AsyncMock(embed=embed_mock),
+        ):
+            query = MemoryQuery(text="test query", limit=5)
+            await pipeline.retrieve(query, wait_for_tracking=True)
+
+        # No yield to the loop needed — writes already happened
+        assert qdrant.update_access.call_count > 0
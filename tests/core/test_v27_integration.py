@@ -5,34 +5,11 @@ Covers: rehydrate endpoint, git-diff endpoint, stale admin endpoints,
 diff_parser extraction, and ML eval harness execution.
 """
 
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Mock storage drivers before importing
-_slowapi_mock = MagicMock()
-_slowapi_mock.Limiter.return_value.limit.return_value = lambda f: f
-
-for mod_name in [
-    "neo4j",
-    "asyncpg",
-    "qdrant_client",
-    "qdrant_client.models",
-    "qdrant_client.http",
-    "qdrant_client.http.models",
-    "redis",
-    "redis.asyncio",
-    "slowapi.errors",
-    "slowapi.util",
-    "sse_starlette",
-    "sse_starlette.sse",
-    "httpx",
-    "arq",
-    "arq.connections",
-]:
-    sys.modules.setdefault(mod_name, MagicMock())
-sys.modules["slowapi"] = _slowapi_mock
+import tests._stub_heavy_deps  # noqa: F401  — mock storage drivers before importing src
 
 
 def test_rehydrate_models_importable():
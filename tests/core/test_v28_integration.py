@@ -5,35 +5,34 @@ Covers: ML type hint in signal detector, feedback-aware decay,
 access-frequency decay modifier, backward compatibility.
 """
 
-import sys
+import functools
+import inspect
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Mock storage drivers before importing
-_slowapi_mock = MagicMock()
-_slowapi_mock.Limiter.return_value.limit.return_value = lambda f: f
-
-for mod_name in [
-    "neo4j",
-    "asyncpg",
-    "qdrant_client",
-    "qdrant_client.models",
-    "qdrant_client.http",
-    "qdrant_client.http.models",
-    "redis",
-    "redis.asyncio",
-    "slowapi.errors",
-    "slowapi.util",
-    "sse_starlette",
-    "sse_starlette.sse",
-    "httpx",
-    "arq",
-    "arq.connections",
-]:
-    sys.modules.setdefault(mod_name, MagicMock())
-sys.modules["slowapi"] = _slowapi_mock
+import tests._stub_heavy_deps  # noqa: F401  — mock storage drivers before importing src
+
+# DecayWorker measures age against the wall clock, so the reference time is
+# taken once at import rather than pinned to a fixed date.
+_NOW = datetime.utcnow()
+_LAST_ACCESSED_24H = (_NOW - timedelta(hours=24)).isoformat()
+_LAST_ACCESSED_48H = (_NOW - timedelta(hours=48)).isoformat()
+_BASE_PAYLOAD = {
+    "importance": 0.8,
+    "stability": 0.1,
+    "last_accessed": _LAST_ACCESSED_24H,
+    "access_count": 5,
+}
+
+
+@functools.cache
+def _detect_sig() -> inspect.Signature:
+    """Signature of SignalDetector.detect, reflected once per session."""
+    from src.core.signal_detector import SignalDetector
+
+    return inspect.signature(SignalDetector().detect)
 
 
 # ── ML Type Hint Tests ─────────────────────────────────
@@ -41,13 +40,8 @@ sys.modules["slowapi"] = _slowapi_mock
 
 def test_signal_detector_accepts_ml_hint():
     """SignalDetector.detect() accepts ml_hint and ml_confidence."""
-    from src.core.signal_detector import SignalDetector
-
-    d = SignalDetector()
     # Just verify the method signature accepts the params
-    import inspect
-
-    sig = inspect.signature(d.detect)
+    sig = _detect_sig()
     assert "ml_hint" in sig.parameters
     assert "ml_confidence" in sig.parameters
 
@@ -128,21 +122,18 @@ async def test_decay_slower_with_high_access_count():
     """Memories with high access_count decay slower."""
     from src.workers.decay import DecayWorker
 
-    now = datetime.utcnow()
-    last_accessed = (now - timedelta(hours=24)).isoformat()
-
     # Memory with 0 accesses
     low_access = {
         "importance": 0.8,
         "stability": 0.1,
-        "last_accessed": last_accessed,
+        "last_accessed": _LAST_ACCESSED_24H,
         "access_count": 0,
     }
     # Memory with 20 accesses
     high_access = {
         "importance": 0.8,
         "stability": 0.1,
-        "last_accessed": last_accessed,
+        "last_accessed": _LAST_ACCESSED_24H,
         "access_count": 20,
     }
 
@@ -176,21 +167,11 @@ async def test_decay_slower_with_positive_feedback():
     """Memories with positive feedback decay slower."""
     from src.workers.decay import DecayWorker
 
-    now = datetime.utcnow()
-    last_accessed = (now - timedelta(hours=24)).isoformat()
-
-    payload = {
-        "importance": 0.8,
-        "stability": 0.1,
-        "last_accessed": last_accessed,
-        "access_count": 5,
-    }
-
     mock_qdrant = MagicMock()
     mock_qdrant.scroll_all = AsyncMock(
         return_value=[
-            ("mem-useful", dict(payload)),
-            ("mem-nofb", dict(payload)),
+            ("mem-useful", _BASE_PAYLOAD.copy()),
+            ("mem-nofb", _BASE_PAYLOAD.copy()),
         ]
     )
     mock_qdrant.update_importance = AsyncMock()
@@ -219,9 +200,6 @@ async def test_decay_pinned_still_immune():
     """Pinned memories are still immune with new modifiers."""
     from src.workers.decay import DecayWorker
 
-    now = datetime.utcnow()
-    last_accessed = (now - timedelta(hours=48)).isoformat()
-
     mock_qdrant = MagicMock()
     mock_qdrant.scroll_all = AsyncMock(
         return_value=[
@@ -230,7 +208,7 @@ async def test_decay_pinned_still_immune():
                 {
                     "importance": 0.9,
                     "stability": 0.1,
-                    "last_accessed": last_accessed,
+                    "last_accessed": _LAST_ACCESSED_48H,
                     "access_count": 0,
                     "pinned": "true",
                 },
@@ -254,9 +232,6 @@ async def test_decay_permanent_still_immune():
     """Permanent memories are still immune with new modifiers."""
     from src.workers.decay import DecayWorker
 
-    now = datetime.utcnow()
-    last_accessed = (now - timedelta(hours=48)).isoformat()
-
     mock_qdrant = MagicMock()
     mock_qdrant.scroll_all = AsyncMock(
         return_value=[
@@ -265,7 +240,7 @@ async def test_decay_permanent_still_immune():
                 {
                     "importance": 0.9,
                     "stability": 0.1,
-                    "last_accessed": last_accessed,
+                    "last_accessed": _LAST_ACCESSED_48H,
                     "access_count": 0,
                     "durability": "permanent",
                 },
@@ -283,14 +258,36 @@ async def test_decay_permanent_still_immune():
     mock_qdrant.update_importance.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_decay_domain_scoped():
+    """domain= limits decay to memories in that domain."""
+    from src.workers.decay import DecayWorker
+
+    mock_qdrant = MagicMock()
+    mock_qdrant.scroll_all = AsyncMock(
+        return_value=[
+            ("mem-in", {**_BASE_PAYLOAD, "domain": "test-integration-a"}),
+            ("mem-out", {**_BASE_PAYLOAD, "domain": "test-integration-b"}),
+        ]
+    )
+    mock_qdrant.update_importance = AsyncMock()
+    mock_neo4j = MagicMock()
+    mock_neo4j.update_importance = AsyncMock()
+
+    worker = DecayWorker(mock_qdrant, mock_neo4j)
+    stats = await worker.run(feedback_stats={}, domain="test-integration-a")
+
+    assert stats["processed"] == 1
+    updated = {c.args[0] for c in mock_qdrant.update_importance.call_args_list}
+    assert updated == {"mem-in"}
+
+
 # ── Signals Pipeline Hint Passthrough ────────────────────
 
 
 def test_signals_imports_ml_hint_params():
     """signals.py passes ml_hint to detector.detect()."""
     # Verify the function exists and is async
-    import inspect
-
     from src.workers import signals
 
     assert inspect.iscoroutinefunction(signals._run_signal_detection)
@@ -1,21 +1,102 @@
 """
 Shared fixtures for Recall integration tests.
 
-All tests hit the live API (default http://localhost:8200).
+All tests hit the live API (default http://localhost:8200), or the app
+in-process when RECALL_TEST_IN_PROCESS=1.
 Each test gets a unique domain for isolation, and cleanup
 deletes all created resources after each test.
+
+Every async test in this directory runs on one session-scoped event
+loop (see pytest_collection_modifyitems), so the pooled HTTP client and
+module-scoped fixtures are created once and reused. Don't override the
+deprecated ``event_loop`` fixture — pick a ``loop_scope`` instead.
 """
 
 import asyncio
+import contextlib
+import json
 import os
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
+from typing import TypeVar
 
 import httpx
 import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
 
 API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
 API_KEY = os.environ.get("RECALL_API_KEY", "")
+# Dispatch requests straight into the FastAPI app (httpx.ASGITransport)
+# instead of over a socket. The storage backends must be reachable from
+# this process; RECALL_API_URL then only supplies the URLs' host part.
+IN_PROCESS = os.environ.get("RECALL_TEST_IN_PROCESS", "") == "1"
+_AUTH_HEADERS: dict[str, str] = {"Authorization": f"Bearer {API_KEY}"} if API_KEY else {}
+
+T = TypeVar("T")
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import h2  # noqa: F401  — installed by httpx[http2]
+except ImportError:  # optional: plain HTTP/1.1 keep-alive pool instead
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
+
+# =============================================================
+# JSON transport
+# =============================================================
+
+
+def _dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def iter_jsonl(response: httpx.Response) -> AsyncIterator[dict]:
+    """Decode a streamed NDJSON response one record at a time.
+
+    Use inside ``client.stream(...)`` so callers can stop at the record they
+    need instead of buffering the whole export. Lines are split on raw bytes
+    and handed to the decoder without a str round trip.
+    """
+    pending = b""
+    async for chunk in response.aiter_bytes():
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _loads(line)
+    if pending.strip():
+        yield _loads(pending)
+
+
+def encode_jsonl(records: list[dict]) -> bytes:
+    """Encode records as an NDJSON upload body (orjson when installed)."""
+    return b"".join(_dumps(record) + b"\n" for record in records)
+
+
+async def post_json(client: httpx.AsyncClient, url: str, payload) -> httpx.Response:
+    """POST a JSON body encoded with orjson when installed.
+
+    Worth it for the bulk helpers below, whose bodies carry up to 100 items;
+    single-memory calls can keep using ``json=``.
+    """
+    return await client.post(
+        url, content=_dumps(payload), headers={"Content-Type": "application/json"}
+    )
 
 
 # =============================================================
@@ -30,8 +111,17 @@ async def request_with_retry(
     max_retries: int = 5,
     **kwargs,
 ) -> httpx.Response:
-    """Execute an HTTP request, retrying on 429 with Retry-After backoff."""
+    """Execute an HTTP request, retrying on 429 with Retry-After backoff.
+
+    ``kwargs`` (including ``files``/``data``) are built once by the caller and
+    passed unchanged to every attempt. File objects in ``files`` are rewound
+    before each attempt so httpx can stream them again.
+    """
     for attempt in range(max_retries + 1):
+        for entry in (kwargs.get("files") or {}).values():
+            fileobj = entry[1] if isinstance(entry, tuple) else entry
+            if hasattr(fileobj, "seek"):
+                fileobj.seek(0)
         r = await getattr(client, method)(url, **kwargs)
         if r.status_code != 429 or attempt == max_retries:
             return r
@@ -41,6 +131,109 @@ async def request_with_retry(
     return r
 
 
+# =============================================================
+# Polling
+# =============================================================
+
+
+async def poll_until(
+    fn: Callable[[], Awaitable[T]],
+    pred: Callable[[T], bool],
+    *,
+    deadline: float = 20.0,
+    initial: float = 0.05,
+    max_delay: float = 1.0,
+) -> T:
+    """Call ``fn`` with exponential backoff until ``pred(result)`` holds.
+
+    Returns the first matching result, or the last result once ``deadline``
+    seconds have passed — the caller asserts on it either way. Keep
+    ``max_delay`` high for rate-limited endpoints (30/minute).
+    """
+    loop = asyncio.get_running_loop()
+    stop_at = loop.time() + deadline
+    delay = initial
+    while True:
+        result = await fn()
+        if pred(result) or loop.time() + delay > stop_at:
+            return result
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+# =============================================================
+# Batch store
+# =============================================================
+
+BATCH_STORE_MAX = 50  # server-side cap on /memory/batch/store items
+
+
+async def store_batch(
+    client: httpx.AsyncClient,
+    payloads: list[dict],
+    cleanup: "CleanupTracker | None" = None,
+) -> list[dict]:
+    """Store memories via POST /memory/batch/store, one embed pass per request.
+
+    Falls back to concurrent single stores if the server predates the batch
+    endpoint. Returns one result dict (``id``, ``created``, ...) per payload,
+    in input order, and registers every ID with ``cleanup`` when given.
+    """
+    results: list[dict] = []
+    for start in range(0, len(payloads), BATCH_STORE_MAX):
+        chunk = payloads[start : start + BATCH_STORE_MAX]
+        r = await post_json(client, f"{API_BASE}/memory/batch/store", {"memories": chunk})
+        if r.status_code == 404:
+            responses = await asyncio.gather(
+                *(client.post(f"{API_BASE}/memory/store", json=p) for p in chunk)
+            )
+            for resp in responses:
+                assert resp.status_code == 200, f"Store failed: {resp.text}"
+            chunk_results = [resp.json() for resp in responses]
+        else:
+            assert r.status_code == 200, f"Batch store failed: {r.text}"
+            body = r.json()
+            # Failed items still carry an id (e.g. created=False, "Neo4j error"
+            # after a compensating delete), so check the error count too
+            assert body["errors"] == 0, f"Batch store had errors: {r.text}"
+            chunk_results = body["results"]
+        for item in chunk_results:
+            assert item["id"], f"Batch item failed: {item}"
+            if cleanup is not None:
+                cleanup.track_memory(item["id"])
+        results.extend(chunk_results)
+    return results
+
+
+BATCH_DELETE_MAX = 100  # server-side cap on /memory/batch/delete ids
+
+
+async def delete_batch(client: httpx.AsyncClient, memory_ids: list[str]) -> None:
+    """Delete memories via POST /memory/batch/delete, one request per 100 IDs.
+
+    Falls back to concurrent single DELETEs if the server predates the batch
+    endpoint. Errors are suppressed — this is a teardown helper.
+    """
+    chunks = [
+        memory_ids[start : start + BATCH_DELETE_MAX]
+        for start in range(0, len(memory_ids), BATCH_DELETE_MAX)
+    ]
+    responses = await asyncio.gather(
+        *(post_json(client, f"{API_BASE}/memory/batch/delete", {"ids": c}) for c in chunks),
+        return_exceptions=True,
+    )
+    fallback = [
+        mid
+        for chunk, r in zip(chunks, responses)
+        if isinstance(r, Exception) or r.status_code != 200
+        for mid in chunk
+    ]
+    await asyncio.gather(
+        *(client.delete(f"{API_BASE}/memory/{mid}") for mid in fallback),
+        return_exceptions=True,
+    )
+
+
 # =============================================================
 # Cleanup tracker
 # =============================================================
@@ -64,29 +257,34 @@ class CleanupTracker:
     def track_document(self, doc_id: str):
         self.document_ids.append(doc_id)
 
+    def untrack_memory(self, memory_id: str):
+        """Forget a memory the test already deleted (skips a 404 teardown call)."""
+        if memory_id in self.memory_ids:
+            self.memory_ids.remove(memory_id)
+
+    def untrack_document(self, doc_id: str):
+        """Forget a document the test already deleted."""
+        if doc_id in self.document_ids:
+            self.document_ids.remove(doc_id)
+
     async def teardown(self):
         """Delete all tracked resources. Errors are suppressed."""
-        # Delete documents first (cascade deletes child memories)
-        for did in self.document_ids:
-            try:
-                await self.client.delete(f"{API_BASE}/document/{did}")
-            except Exception:
-                pass
-
-        for sid in self.session_ids:
-            try:
-                await self.client.post(
+        # Documents (whose deletes cascade to their untracked child
+        # memories), sessions and tracked memories are independent, so the
+        # whole teardown is one concurrent fan-out. return_exceptions=True
+        # keeps the suppress-all-errors semantics.
+        await asyncio.gather(
+            *(self.client.delete(f"{API_BASE}/document/{did}") for did in self.document_ids),
+            *(
+                self.client.post(
                     f"{API_BASE}/session/end",
                     json={"session_id": sid, "trigger_consolidation": False},
                 )
-            except Exception:
-                pass
-
-        for mid in self.memory_ids:
-            try:
-                await self.client.delete(f"{API_BASE}/memory/{mid}")
-            except Exception:
-                pass
+                for sid in self.session_ids
+            ),
+            delete_batch(self.client, self.memory_ids),
+            return_exceptions=True,
+        )
 
 
 # =============================================================
@@ -96,6 +294,19 @@ class CleanupTracker:
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')")
+    # Registered by pytest-xdist too; declared here so serial runs don't warn
+    config.addinivalue_line("markers", "xdist_group(name): run grouped tests on one xdist worker")
+
+
+_INTEGRATION_DIR = os.path.dirname(__file__)
+
+
+def pytest_collection_modifyitems(items):
+    """Run integration tests on the session loop so they can share one client."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and str(item.path).startswith(_INTEGRATION_DIR):
+            item.add_marker(session_loop, append=False)
 
 
 # =============================================================
@@ -103,16 +314,11 @@ def pytest_configure(config):
 # =============================================================
 
 
-def _auth_headers() -> dict[str, str]:
-    """Return auth headers if API key is configured."""
-    if API_KEY:
-        return {"Authorization": f"Bearer {API_KEY}"}
-    return {}
-
-
 @pytest.fixture(scope="session", autouse=True)
 def ensure_healthy():
     """Skip all tests if the API is not reachable or unhealthy."""
+    if IN_PROCESS:
+        return  # no server to probe; _session_client checks the app's /health
     try:
         r = httpx.get(f"{API_BASE}/health", timeout=10.0)
         data = r.json()
@@ -123,24 +329,106 @@ def ensure_healthy():
 
 
 # =============================================================
-# Function-scoped: per-test client and isolation
+# Session-scoped client, function-scoped isolation
 # =============================================================
 
 
-@pytest.fixture
-async def api_client():
-    """Function-scoped httpx async client — avoids event loop lifetime issues."""
-    async with httpx.AsyncClient(timeout=60.0, headers=_auth_headers()) as client:
+@contextlib.asynccontextmanager
+async def _transport():
+    """Yield the pooled socket transport, or the in-process app transport."""
+    if IN_PROCESS:
+        from src.api.main import app
+
+        # ASGITransport doesn't run lifespan events, so open the storage
+        # connections the way uvicorn would
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                await stack.enter_async_context(app.router.lifespan_context(app))
+            except Exception as exc:
+                pytest.skip(f"In-process app failed to start ({exc}) — skipping integration tests")
+            yield httpx.ASGITransport(app=app)
+        return
+
+    # retries= covers connection failures only; 429s still go through
+    # request_with_retry, which honours the rate-limit window.
+    yield httpx.AsyncHTTPTransport(
+        retries=3,
+        # Multiplexes gather()-ed requests when the server negotiates h2;
+        # the keep-alive pool below covers HTTP/1.1 servers either way
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_keepalive_connections=64, max_connections=128, keepalive_expiry=30.0
+        ),
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_client():
+    """One httpx async client for the whole run — keeps the connection pool warm.
+
+    ``base_url`` is set so helpers can use relative paths; absolute URLs still work.
+    Every test request goes through this client (via ``api_client``), which is
+    what lets ``RECALL_TEST_IN_PROCESS=1`` cover the whole suite — don't open
+    ad-hoc clients in tests.
+    """
+    # A custom transport owns the pool, so http2/limits are configured there.
+    async with _transport() as transport, httpx.AsyncClient(
+        base_url=API_BASE,
+        # Fail fast when the API is down; reads stay long for LLM-backed routes
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        headers=_AUTH_HEADERS,
+        transport=transport,
+    ) as client:
+        if IN_PROCESS:
+            r = await client.get("/health")
+            if r.json().get("status") not in ("healthy", "degraded"):
+                pytest.skip("In-process app not healthy — skipping integration tests")
         yield client
 
 
+@pytest.fixture
+def api_client(_session_client):
+    """Shared client with per-test state (headers, cookies) reset to defaults.
+
+    A plain sync fixture — the reset needs no await, so read-only tests
+    (health, validation) that request only this pay no async setup.
+    """
+    _session_client.headers = _AUTH_HEADERS
+    _session_client.cookies.clear()
+    return _session_client
+
+
+# "gw0", "gw1", ... under pytest-xdist; empty for serial runs
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+_DOMAIN_PREFIX = f"test-integration-{_XDIST_WORKER}-" if _XDIST_WORKER else "test-integration-"
+
+
 @pytest.fixture
 def test_domain():
-    """Return a unique domain string for test isolation."""
-    return f"test-integration-{uuid.uuid4().hex[:12]}"
+    """Return a unique domain string for test isolation.
+
+    Under xdist the worker id is part of the domain, so leftovers in
+    Qdrant/Neo4j can be traced to the worker that created them.
+    """
+    return f"{_DOMAIN_PREFIX}{uuid.uuid4().hex[:12]}"
+
+
+_UID_POOL: list[str] = []
 
 
 @pytest.fixture
+def uid():
+    """Return one short hex marker per test for unique content and filenames.
+
+    Markers come from a pool filled 1024 at a time from a single urandom read.
+    """
+    if not _UID_POOL:
+        pool = os.urandom(4 * 1024).hex()
+        _UID_POOL.extend(pool[i : i + 8] for i in range(0, len(pool), 8))
+    return _UID_POOL.pop()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def cleanup(api_client):
     """Provide a CleanupTracker that tears down after the test."""
     tracker = CleanupTracker(client=api_client)
@@ -196,6 +484,25 @@ def stored_memory(api_client, test_domain, cleanup):
     return _store
 
 
+@pytest.fixture
+def stored_memories_batch(api_client, test_domain, cleanup):
+    """
+    Factory fixture: store several memories in one batch request.
+
+    Items are store payloads; ``domain`` defaults to ``test_domain``.
+    Returns one result dict per item, in order, all registered for cleanup.
+
+    Usage:
+        a, b = await stored_memories_batch([{"content": "x"}, {"content": "y"}])
+    """
+
+    async def _store_many(items: list[dict]) -> list[dict]:
+        payloads = [{"domain": test_domain, **item} for item in items]
+        return await store_batch(api_client, payloads, cleanup)
+
+    return _store_many
+
+
 @pytest.fixture
 def active_session(api_client, cleanup):
     """
@@ -225,3 +532,118 @@ def active_session(api_client, cleanup):
         return data
 
     return _start
+
+
+# =============================================================
+# Seeded private domains (shared-fixture template)
+# =============================================================
+
+
+def private_domain(label: str) -> str:
+    """Return a unique domain for a shared fixture, e.g. ``test-integration-corpus-<hex>``.
+
+    Uses the same prefix as ``test_domain``, so the xdist worker id is kept.
+    """
+    return f"{_DOMAIN_PREFIX}{label}-{uuid.uuid4().hex[:12]}"
+
+
+@contextlib.asynccontextmanager
+async def seeded_memories(
+    client: httpx.AsyncClient, payloads: list[dict]
+) -> AsyncIterator[list[dict]]:
+    """Store ``payloads`` with store_batch and yield the results in input order.
+
+    Every stored memory is deleted on exit, even if seeding or the caller
+    fails. Shared class/module/session fixtures pass ``_session_client``.
+    """
+    tracker = CleanupTracker(client=client)
+    try:
+        yield await store_batch(client, payloads, tracker)
+    finally:
+        await tracker.teardown()
+
+
+# =============================================================
+# Module-scoped: shared read-only corpus
+# =============================================================
+
+# (content, memory_type) pairs; "{domain}" is filled per module so
+# repeated runs don't collide with content-hash dedup.
+_SEED_CORPUS: list[tuple[str, str]] = [
+    ("Redis is used for caching to reduce database load ({domain})", "semantic"),
+    ("Deployed Redis cluster using Helm chart v6.3 ({domain})", "episodic"),
+    ("fact about testing frameworks ({domain})", "semantic"),
+    ("workflow: run pytest then deploy ({domain})", "procedural"),
+    ("token estimation check ({domain})", "semantic"),
+    *(
+        (
+            f"This is a moderately long memory entry number {i} about software "
+            f"architecture patterns including microservices, event sourcing, and CQRS "
+            "for domain {domain}",
+            "semantic",
+        )
+        for i in range(5)
+    ),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_corpus(_session_client):
+    """
+    Store a canonical corpus once per module for read-only tests.
+
+    Yields {"domain": str, "ids": list[str]}. Tests that mutate state
+    should keep using stored_memory with their own test_domain.
+    """
+    domain = private_domain("corpus")
+    payloads = [
+        {"content": content.format(domain=domain), "memory_type": memory_type, "domain": domain}
+        for content, memory_type in _SEED_CORPUS
+    ]
+
+    async with seeded_memories(_session_client, payloads) as stored:
+        yield {"domain": domain, "ids": [item["id"] for item in stored]}
+
+
+# =============================================================
+# Session-scoped: named read-only memories
+# =============================================================
+
+# name -> store payload; "{domain}" is filled per session so repeated runs
+# don't collide with content-hash dedup.
+_BULK_SEED: dict[str, dict] = {
+    "alpha": {"content": "alpha content unique ({domain})"},
+    "beta": {"content": "beta content unique ({domain})"},
+    "metadata": {
+        "content": "metadata carrier ({domain})",
+        "metadata": {"project": "recall", "version": 2},
+    },
+    "retrievable": {"content": "retrievable memory ({domain})"},
+    "export": {"content": "Export test memory for ops ({domain})"},
+    "export_embedding": {"content": "Embedding export test ({domain})"},
+}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bulk_seed(_session_client):
+    """
+    Store every named read-only memory in one batch request per session.
+
+    Yields {"domain": str, "memories": {name: payload + store result}}.
+    Tests that update or delete a memory must create their own with
+    stored_memory.
+    """
+    domain = private_domain("seed")
+    payloads = [
+        {**spec, "content": spec["content"].format(domain=domain), "domain": domain}
+        for spec in _BULK_SEED.values()
+    ]
+
+    async with seeded_memories(_session_client, payloads) as stored:
+        yield {
+            "domain": domain,
+            "memories": {
+                name: {**payload, **item}
+                for name, payload, item in zip(_BULK_SEED, payloads, stored)
+            },
+        }
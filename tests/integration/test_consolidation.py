@@ -9,10 +9,10 @@ import asyncio
 
 import pytest
 
-from tests.integration.conftest import API_BASE
+from tests.integration.conftest import API_BASE, store_batch
 
-# Give embeddings time to index
-EMBED_DELAY = 0.5
+# Memory.stability default — /memory/store never sets it explicitly
+DEFAULT_STABILITY = 0.1
 
 
 @pytest.mark.slow
@@ -28,6 +28,11 @@ class TestConsolidation:
         cleanup.track_memory(data["id"])
         return data
 
+    async def _store_many(self, api_client, cleanup, texts, domain, **kwargs):
+        """Helper: store texts in one batch request, return results in input order."""
+        payloads = [{"content": text, "domain": domain, **kwargs} for text in texts]
+        return await store_batch(api_client, payloads, cleanup)
+
     async def test_similar_memories_consolidate(self, api_client, test_domain, cleanup):
         """Store 3 paraphrases → consolidate → a merged memory exists."""
         # Content must be similar enough for consolidation (cosine > 0.8)
@@ -37,18 +42,9 @@ class TestConsolidation:
             "Python requires indentation to enforce code readability",
             "Indentation in Python enforces readable and consistent code style",
         ]
-        source_ids = []
-        for text in paraphrases:
-            data = await self._store_and_track(
-                api_client,
-                cleanup,
-                text,
-                test_domain,
-                tags=["python", "language"],
-            )
-            source_ids.append(data["id"])
-
-        await asyncio.sleep(EMBED_DELAY)
+        await self._store_many(
+            api_client, cleanup, paraphrases, test_domain, tags=["python", "language"]
+        )
 
         r = await api_client.post(
             f"{API_BASE}/admin/consolidate",
@@ -69,17 +65,8 @@ class TestConsolidation:
             "Docker containers provide lightweight process isolation",
             "Docker provides lightweight isolation using containers",
         ]
-        source_ids = []
-        for text in texts:
-            data = await self._store_and_track(
-                api_client,
-                cleanup,
-                text,
-                test_domain,
-            )
-            source_ids.append(data["id"])
-
-        await asyncio.sleep(EMBED_DELAY)
+        stored = await self._store_many(api_client, cleanup, texts, test_domain)
+        source_ids = [data["id"] for data in stored]
 
         r = await api_client.post(
             f"{API_BASE}/admin/consolidate",
@@ -94,14 +81,13 @@ class TestConsolidation:
         merged_id = body["results"][0]["merged_id"]
         cleanup.track_memory(merged_id)
 
-        # Verify at least one source is superseded
-        # (Qdrant payload should now have superseded_by set)
-        for sid in source_ids:
-            mem_r = await api_client.get(f"{API_BASE}/memory/{sid}")
-            if mem_r.status_code == 200:
-                # The GET response model may not expose superseded_by,
-                # but the memory should still be retrievable
-                pass
+        # Sources are superseded (superseded_by set in the Qdrant payload),
+        # not deleted. The GET response model may not expose superseded_by,
+        # but every source should still be retrievable
+        results = await asyncio.gather(
+            *(api_client.get(f"{API_BASE}/memory/{sid}") for sid in source_ids)
+        )
+        assert all(mr.status_code == 200 for mr in results)
 
     async def test_derived_from_relationships_created(self, api_client, test_domain, cleanup):
         """After consolidation, merged memory has DERIVED_FROM relationships to sources."""
@@ -109,17 +95,8 @@ class TestConsolidation:
             "Kubernetes orchestrates container workloads across clusters",
             "Kubernetes manages and orchestrates containers in clusters",
         ]
-        source_ids = []
-        for text in texts:
-            data = await self._store_and_track(
-                api_client,
-                cleanup,
-                text,
-                test_domain,
-            )
-            source_ids.append(data["id"])
-
-        await asyncio.sleep(EMBED_DELAY)
+        stored = await self._store_many(api_client, cleanup, texts, test_domain)
+        source_ids = [data["id"] for data in stored]
 
         r = await api_client.post(
             f"{API_BASE}/admin/consolidate",
@@ -145,7 +122,7 @@ class TestConsolidation:
         )
         assert rel_r.status_code == 200
         related = rel_r.json().get("related", [])
-        related_ids = [r.get("id", r.get("memory_id", "")) for r in related]
+        related_ids = [item.get("id") or item.get("memory_id", "") for item in related]
         assert merged_id in related_ids, f"Expected merged ID {merged_id} in related {related_ids}"
 
     async def test_merged_memory_has_boosted_stability(self, api_client, test_domain, cleanup):
@@ -154,29 +131,13 @@ class TestConsolidation:
             "Redis is an in-memory data structure store",
             "Redis is an in-memory database used as a cache",
         ]
-        source_data = []
-        for text in texts:
-            data = await self._store_and_track(
-                api_client,
-                cleanup,
-                text,
-                test_domain,
-                importance=0.5,
-            )
-            source_data.append(data)
-
-        await asyncio.sleep(EMBED_DELAY)
-
-        # Get source stability before consolidation
-        source_stabilities = []
-        for sd in source_data:
-            mr = await api_client.get(f"{API_BASE}/memory/{sd['id']}")
-            if mr.status_code == 200:
-                source_stabilities.append(mr.json().get("stability", 0.1))
+        await self._store_many(
+            api_client, cleanup, texts, test_domain, importance=0.5
+        )
 
         r = await api_client.post(
             f"{API_BASE}/admin/consolidate",
-            json={"domain": test_domain, "min_cluster_size": 2},
+            json={"domain": test_domain, "min_cluster_size": 2, "include_merged": True},
         )
         assert r.status_code == 200
         body = r.json()
@@ -187,37 +148,39 @@ class TestConsolidation:
         merged_id = body["results"][0]["merged_id"]
         cleanup.track_memory(merged_id)
 
-        merged_r = await api_client.get(f"{API_BASE}/memory/{merged_id}")
-        assert merged_r.status_code == 200
-        merged_stability = merged_r.json()["stability"]
+        merged_stability = body["results"][0]["merged"]["stability"]
 
-        max_source = max(source_stabilities) if source_stabilities else 0.1
+        # Freshly stored sources all sit at the default stability
+        max_source = DEFAULT_STABILITY
         assert merged_stability > max_source, (
             f"Merged stability {merged_stability} should exceed max source {max_source}"
         )
 
     async def test_merged_memory_inherits_all_tags(self, api_client, test_domain, cleanup):
         """Union of source tags should appear on the merged memory."""
-        await self._store_and_track(
-            api_client,
-            cleanup,
-            "Git branching strategies for team collaboration",
-            test_domain,
-            tags=["git", "branching"],
-        )
-        await self._store_and_track(
-            api_client,
-            cleanup,
-            "Git branch strategies help teams collaborate on code",
-            test_domain,
-            tags=["git", "teamwork"],
-        )
-
-        await asyncio.sleep(EMBED_DELAY)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(
+                self._store_and_track(
+                    api_client,
+                    cleanup,
+                    "Git branching strategies for team collaboration",
+                    test_domain,
+                    tags=["git", "branching"],
+                )
+            )
+            tg.create_task(
+                self._store_and_track(
+                    api_client,
+                    cleanup,
+                    "Git branch strategies help teams collaborate on code",
+                    test_domain,
+                    tags=["git", "teamwork"],
+                )
+            )
 
         r = await api_client.post(
             f"{API_BASE}/admin/consolidate",
-            json={"domain": test_domain, "min_cluster_size": 2},
+            json={"domain": test_domain, "min_cluster_size": 2, "include_merged": True},
         )
         assert r.status_code == 200
         body = r.json()
@@ -228,9 +191,7 @@ class TestConsolidation:
         merged_id = body["results"][0]["merged_id"]
         cleanup.track_memory(merged_id)
 
-        merged_r = await api_client.get(f"{API_BASE}/memory/{merged_id}")
-        assert merged_r.status_code == 200
-        merged_tags = set(merged_r.json()["tags"])
+        merged_tags = set(body["results"][0]["merged"]["tags"])
 
         expected_tags = {"git", "branching", "teamwork"}
         assert expected_tags.issubset(merged_tags), (
@@ -243,17 +204,8 @@ class TestConsolidation:
             "Nginx is a high-performance web server and reverse proxy",
             "Nginx serves as a fast web server and reverse proxy",
         ]
-        source_ids = []
-        for text in texts:
-            data = await self._store_and_track(
-                api_client,
-                cleanup,
-                text,
-                test_domain,
-            )
-            source_ids.append(data["id"])
-
-        await asyncio.sleep(EMBED_DELAY)
+        stored = await self._store_many(api_client, cleanup, texts, test_domain)
+        source_ids = [data["id"] for data in stored]
 
         r = await api_client.post(
             f"{API_BASE}/admin/consolidate",
@@ -268,6 +220,7 @@ class TestConsolidation:
         assert len(body["results"]) == 0
 
         # Source memories should still be individually retrievable
-        for sid in source_ids:
-            mr = await api_client.get(f"{API_BASE}/memory/{sid}")
-            assert mr.status_code == 200
+        results = await asyncio.gather(
+            *(api_client.get(f"{API_BASE}/memory/{sid}") for sid in source_ids)
+        )
+        assert all(mr.status_code == 200 for mr in results)
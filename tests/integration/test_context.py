@@ -2,32 +2,16 @@
 Tests for context assembly: POST /search/context.
 """
 
-import asyncio
-
 import pytest
 
 from tests.integration.conftest import API_BASE
 
-EMBED_DELAY = 0.5
-
 
 class TestContextAssembly:
     """POST /search/context"""
 
-    async def test_context_returns_markdown(self, stored_memory, api_client, test_domain):
+    async def test_context_returns_markdown(self, seeded_corpus, api_client):
         """Context response should be formatted markdown with sections."""
-        await stored_memory(
-            "Redis is used for caching to reduce database load",
-            memory_type="semantic",
-            domain=test_domain,
-        )
-        await stored_memory(
-            "Deployed Redis cluster using Helm chart v6.3",
-            memory_type="episodic",
-            domain=test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
-
         r = await api_client.post(
             f"{API_BASE}/search/context",
             json={"query": "Redis caching", "max_tokens": 2000},
@@ -42,12 +26,8 @@ class TestContextAssembly:
         if data["memories_used"] > 0:
             assert "##" in data["context"]
 
-    async def test_breakdown_structure(self, stored_memory, api_client, test_domain):
+    async def test_breakdown_structure(self, seeded_corpus, api_client):
         """Breakdown should contain expected keys."""
-        await stored_memory("fact about testing frameworks", memory_type="semantic", domain=test_domain)
-        await stored_memory("workflow: run pytest then deploy", memory_type="procedural", domain=test_domain)
-        await asyncio.sleep(EMBED_DELAY)
-
         r = await api_client.post(
             f"{API_BASE}/search/context",
             json={"query": "testing frameworks", "max_tokens": 2000},
@@ -63,17 +43,9 @@ class TestContextAssembly:
         # At least one type should have memories
         assert sum(breakdown.values()) >= 1
 
-    async def test_token_limit_truncation(self, stored_memory, api_client, test_domain):
+    async def test_token_limit_truncation(self, seeded_corpus, api_client):
         """Very low max_tokens should truncate the output."""
-        # Store enough content to potentially exceed the token limit
-        for i in range(5):
-            await stored_memory(
-                f"This is a moderately long memory entry number {i} about software architecture "
-                f"patterns including microservices, event sourcing, and CQRS for domain {test_domain}",
-                domain=test_domain,
-            )
-        await asyncio.sleep(EMBED_DELAY)
-
+        # The seeded corpus holds enough content to exceed the token limit
         r = await api_client.post(
             f"{API_BASE}/search/context",
             json={"query": "software architecture", "max_tokens": 50},
@@ -94,7 +66,6 @@ class TestContextAssembly:
             session_id=sid,
             domain=test_domain,
         )
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/context",
@@ -121,7 +92,6 @@ class TestContextAssembly:
             session_id=sid,
             domain=test_domain,
         )
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/context",
@@ -147,11 +117,8 @@ class TestContextAssembly:
         assert data["memories_used"] == 0
         assert data["context"] == ""
 
-    async def test_estimated_tokens(self, stored_memory, api_client, test_domain):
+    async def test_estimated_tokens(self, seeded_corpus, api_client):
         """estimated_tokens should be a non-negative integer."""
-        await stored_memory("token estimation check", domain=test_domain)
-        await asyncio.sleep(EMBED_DELAY)
-
         r = await api_client.post(
             f"{API_BASE}/search/context",
             json={"query": "token estimation", "max_tokens": 2000},
@@ -2,12 +2,15 @@
 Tests for importance decay via POST /admin/decay.
 
 These tests store memories, trigger decay with simulated time passage,
-and verify that importance values change correctly.
+and verify that importance values change correctly. Decay is scoped to
+the test's own domain so the class is safe to run under pytest-xdist.
 """
 
+import asyncio
+
 import pytest
 
-from tests.integration.conftest import API_BASE
+from tests.integration.conftest import API_BASE, store_batch
 
 
 @pytest.mark.slow
@@ -23,6 +26,11 @@ class TestDecay:
         cleanup.track_memory(data["id"])
         return data
 
+    async def _store_many(self, api_client, cleanup, contents, domain, **kwargs):
+        """Helper: store contents in one batch request, return results in input order."""
+        payloads = [{"content": content, "domain": domain, **kwargs} for content in contents]
+        return await store_batch(api_client, payloads, cleanup)
+
     async def test_decay_reduces_importance(
         self, api_client, test_domain, cleanup
     ):
@@ -37,7 +45,7 @@ class TestDecay:
         # Trigger decay with 48-hour offset
         r = await api_client.post(
             f"{API_BASE}/admin/decay",
-            json={"simulate_hours": 48.0},
+            json={"simulate_hours": 48.0, "domain": test_domain},
         )
         assert r.status_code == 200
         stats = r.json()
@@ -57,15 +65,12 @@ class TestDecay:
         """High stability memory should retain more importance than low stability."""
         # Store with high stability (we can't set stability directly via API,
         # but we can store two memories and compare relative decay)
-        high = await self._store_and_track(
-            api_client, cleanup,
-            "High stability memory for decay comparison",
-            test_domain,
-            importance=0.8,
-        )
-        low = await self._store_and_track(
+        high, low = await self._store_many(
             api_client, cleanup,
-            "Low stability memory for decay comparison",
+            [
+                "High stability memory for decay comparison",
+                "Low stability memory for decay comparison",
+            ],
             test_domain,
             importance=0.8,
         )
@@ -76,15 +81,17 @@ class TestDecay:
         # This test verifies the decay mechanism works at all.
         r = await api_client.post(
             f"{API_BASE}/admin/decay",
-            json={"simulate_hours": 48.0},
+            json={"simulate_hours": 48.0, "domain": test_domain},
         )
         assert r.status_code == 200
         stats = r.json()
         assert stats["processed"] >= 2
 
         # Verify both decayed
-        high_r = await api_client.get(f"{API_BASE}/memory/{high['id']}")
-        low_r = await api_client.get(f"{API_BASE}/memory/{low['id']}")
+        high_r, low_r = await asyncio.gather(
+            api_client.get(f"{API_BASE}/memory/{high['id']}"),
+            api_client.get(f"{API_BASE}/memory/{low['id']}"),
+        )
         assert high_r.status_code == 200
         assert low_r.status_code == 200
 
@@ -108,7 +115,7 @@ class TestDecay:
 
         r = await api_client.post(
             f"{API_BASE}/admin/decay",
-            json={"simulate_hours": 0.1},
+            json={"simulate_hours": 0.1, "domain": test_domain},
         )
         assert r.status_code == 200
 
@@ -134,7 +141,7 @@ class TestDecay:
 
         r = await api_client.post(
             f"{API_BASE}/admin/decay",
-            json={"simulate_hours": 500.0},
+            json={"simulate_hours": 500.0, "domain": test_domain},
         )
         assert r.status_code == 200
 
@@ -149,26 +156,26 @@ class TestDecay:
         self, api_client, test_domain, cleanup
     ):
         """Decay should reduce importance but never remove memories."""
-        ids = []
-        for i in range(5):
-            data = await self._store_and_track(
-                api_client, cleanup,
-                f"Persistence test memory number {i}",
-                test_domain,
-                importance=0.3,
-            )
-            ids.append(data["id"])
+        stored = await self._store_many(
+            api_client, cleanup,
+            [f"Persistence test memory number {i}" for i in range(5)],
+            test_domain,
+            importance=0.3,
+        )
+        ids = [data["id"] for data in stored]
 
         # Aggressive decay
         r = await api_client.post(
             f"{API_BASE}/admin/decay",
-            json={"simulate_hours": 200.0},
+            json={"simulate_hours": 200.0, "domain": test_domain},
         )
         assert r.status_code == 200
 
         # All 5 memories should still exist
-        for mid in ids:
-            mem_r = await api_client.get(f"{API_BASE}/memory/{mid}")
+        responses = await asyncio.gather(
+            *(api_client.get(f"{API_BASE}/memory/{mid}") for mid in ids)
+        )
+        for mid, mem_r in zip(ids, responses):
             assert mem_r.status_code == 200, (
                 f"Memory {mid} was deleted by decay"
             )
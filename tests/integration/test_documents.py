@@ -10,8 +10,9 @@ import os
 import uuid
 
 import pytest
+import pytest_asyncio
 
-from tests.integration.conftest import request_with_retry
+from tests.integration.conftest import private_domain, request_with_retry
 
 API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
 
@@ -21,26 +22,51 @@ API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
 # =============================================================
 
 
-async def ingest_text(api_client, content: str, filename: str, domain: str = "test-docs"):
-    """Upload a plaintext file for ingestion."""
-    files = {"file": (filename, content.encode(), "text/plain")}
+def _upload_body(content: str | bytes) -> bytes:
+    """Encode the upload body once; pre-encoded bytes are passed through."""
+    return content.encode() if isinstance(content, str) else content
+
+
+async def ingest_text(
+    api_client,
+    content: str | bytes,
+    filename: str,
+    domain: str,
+    durability: str | None = None,
+):
+    """Upload a plaintext file for ingestion (str or pre-encoded bytes)."""
     data = {"domain": domain, "file_type": "text"}
-    r = await request_with_retry(
-        api_client, "post", f"{API_BASE}/document/ingest",
-        files=files, data=data,
+    if durability:
+        data["durability"] = durability
+    return await request_with_retry(
+        api_client, "post", "/document/ingest",
+        files={"file": (filename, _upload_body(content), "text/plain")}, data=data,
     )
-    return r
 
 
-async def ingest_markdown(api_client, content: str, filename: str, domain: str = "test-docs"):
-    """Upload a markdown file for ingestion."""
-    files = {"file": (filename, content.encode(), "text/markdown")}
+async def ingest_markdown(api_client, content: str | bytes, filename: str, domain: str):
+    """Upload a markdown file for ingestion (str or pre-encoded bytes)."""
     data = {"domain": domain, "file_type": "markdown"}
-    r = await request_with_retry(
-        api_client, "post", f"{API_BASE}/document/ingest",
-        files=files, data=data,
+    return await request_with_retry(
+        api_client, "post", "/document/ingest",
+        files={"file": (filename, _upload_body(content), "text/markdown")}, data=data,
     )
-    return r
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def _require_docs(_session_client):
+    """Skip ingesting tests if the server can't ingest documents.
+
+    Checked once per module so a stripped-down server fails in one request
+    instead of every ingest test waiting out its own timeout. Tests that
+    don't ingest (e.g. request validation) don't request it and still run.
+    """
+    r = await _session_client.get("/document/")
+    if r.status_code == 404:
+        pytest.skip("document routes not enabled on this server")
+    health = (await _session_client.get("/health")).json()
+    if not str(health.get("checks", {}).get("ollama", "")).startswith("ok"):
+        pytest.skip("Ollama unavailable — document ingest needs embeddings")
 
 
 # =============================================================
@@ -52,16 +78,15 @@ class TestDocumentIngest:
     """Test document upload and ingestion."""
 
     @pytest.mark.slow
-    async def test_ingest_plaintext(self, api_client, cleanup):
+    async def test_ingest_plaintext(self, api_client, cleanup, test_domain, uid, _require_docs):
         """Ingest a plaintext file — should create document + child memories."""
-        uid = uuid.uuid4().hex[:8]
         content = (
             f"The API server runs on port 8200. It uses FastAPI with Qdrant for vector search. "
             f"The database is PostgreSQL for audit logs. Unique: {uid}.\n\n"
             f"Redis handles session state and caching. Neo4j stores the memory graph. "
             f"Ollama runs on a separate machine with an RTX 3090 GPU."
         )
-        r = await ingest_text(api_client, content, f"test-{uid}.txt")
+        r = await ingest_text(api_client, content, f"test-{uid}.txt", test_domain)
         assert r.status_code == 200, f"Ingest failed: {r.text}"
         data = r.json()
 
@@ -73,9 +98,10 @@ class TestDocumentIngest:
         assert len(data["child_ids"]) == data["memories_created"]
 
     @pytest.mark.slow
-    async def test_ingest_markdown_chunks_by_headings(self, api_client, cleanup):
+    async def test_ingest_markdown_chunks_by_headings(
+        self, api_client, cleanup, test_domain, uid, _require_docs
+    ):
         """Markdown should be chunked by headings."""
-        uid = uuid.uuid4().hex[:8]
         content = (
             f"# Architecture Overview {uid}\n\n"
             "The system uses a microservices architecture.\n\n"
@@ -84,7 +110,7 @@ class TestDocumentIngest:
             "## API Layer\n\n"
             "FastAPI serves the REST API with rate limiting.\n"
         )
-        r = await ingest_markdown(api_client, content, f"arch-{uid}.md")
+        r = await ingest_markdown(api_client, content, f"arch-{uid}.md", test_domain)
         assert r.status_code == 200, f"Ingest failed: {r.text}"
         data = r.json()
         cleanup.track_document(data["document"]["id"])
@@ -92,17 +118,19 @@ class TestDocumentIngest:
         assert data["document"]["file_type"] == "markdown"
         assert data["memories_created"] > 0
 
-    async def test_duplicate_file_hash_rejected(self, api_client, cleanup):
+    async def test_duplicate_file_hash_rejected(
+        self, api_client, cleanup, test_domain, uid, _require_docs
+    ):
         """Uploading the same file twice should return 409."""
-        uid = uuid.uuid4().hex[:8]
-        # Use deterministic content that will produce the same hash
-        content = f"Duplicate test content for documents {uid}"
+        # Use deterministic content that will produce the same hash;
+        # encode once and upload the same bytes both times
+        content = f"Duplicate test content for documents {uid}".encode()
 
-        r1 = await ingest_text(api_client, content, f"dup1-{uid}.txt")
+        r1 = await ingest_text(api_client, content, f"dup1-{uid}.txt", test_domain)
         if r1.status_code == 200:
             cleanup.track_document(r1.json()["document"]["id"])
 
-            r2 = await ingest_text(api_client, content, f"dup2-{uid}.txt")
+            r2 = await ingest_text(api_client, content, f"dup2-{uid}.txt", test_domain)
             assert r2.status_code == 409
 
     async def test_invalid_file_type_400(self, api_client):
@@ -115,48 +143,65 @@ class TestDocumentIngest:
         assert r.status_code == 400
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def sample_document(_session_client, _require_docs):
+    """
+    Ingest one permanent document shared by the read-only CRUD tests and
+    TestDocumentCascadeOps.
+
+    LLM chunking is the most expensive step in this module, so it runs
+    once. Yields the ingest response body; the document (and its
+    children) is deleted at module teardown. Tests that delete a document
+    ingest their own.
+    """
+    uid = uuid.uuid4().hex[:8]
+    content = (
+        f"Sample document {uid}. Qdrant vector database stores embeddings. "
+        "PostgreSQL handles audit logging. CasaOS runs at 192.168.50.19."
+    )
+    r = await ingest_text(
+        _session_client, content, f"sample-{uid}.txt",
+        private_domain("docs"), durability="permanent",
+    )
+    assert r.status_code == 200, f"Ingest failed: {r.text}"
+    body = r.json()
+    yield body
+    try:
+        await _session_client.delete(f"{API_BASE}/document/{body['document']['id']}")
+    except Exception:
+        pass
+
+
 class TestDocumentCRUD:
     """Test document listing, detail, and deletion."""
 
     @pytest.mark.slow
-    async def test_list_documents(self, api_client, cleanup):
+    async def test_list_documents(self, api_client, sample_document):
         """List should return ingested documents."""
-        uid = uuid.uuid4().hex[:8]
-        content = f"List test document content {uid}. Contains infrastructure facts about deployment."
-        r = await ingest_text(api_client, content, f"list-{uid}.txt")
-        if r.status_code == 200:
-            cleanup.track_document(r.json()["document"]["id"])
-
         r = await api_client.get(f"{API_BASE}/document/")
         assert r.status_code == 200
         docs = r.json()
         assert isinstance(docs, list)
-        # Should have at least the one we just created
+        # Should have at least the shared sample document
         assert len(docs) >= 1
 
     @pytest.mark.slow
-    async def test_get_document_detail(self, api_client, cleanup):
+    async def test_get_document_detail(self, api_client, sample_document):
         """Get should return document with child_memory_ids."""
-        uid = uuid.uuid4().hex[:8]
-        content = f"Detail test document {uid}. Redis caches session data on port 6379."
-        r = await ingest_text(api_client, content, f"detail-{uid}.txt")
-        assert r.status_code == 200
-        doc_id = r.json()["document"]["id"]
-        cleanup.track_document(doc_id)
+        doc = sample_document["document"]
 
-        r = await api_client.get(f"{API_BASE}/document/{doc_id}")
+        r = await api_client.get(f"{API_BASE}/document/{doc['id']}")
         assert r.status_code == 200
         detail = r.json()
         assert "child_memory_ids" in detail
         assert isinstance(detail["child_memory_ids"], list)
-        assert detail["filename"] == f"detail-{uid}.txt"
+        assert detail["filename"] == doc["filename"]
 
     @pytest.mark.slow
-    async def test_delete_cascade(self, api_client, cleanup):
+    async def test_delete_cascade(self, api_client, cleanup, test_domain, uid, _require_docs):
         """Delete should remove document and all children."""
-        uid = uuid.uuid4().hex[:8]
         content = f"Delete cascade test {uid}. Neo4j runs on bolt://localhost:7687."
-        r = await ingest_text(api_client, content, f"del-{uid}.txt")
+        r = await ingest_text(api_client, content, f"del-{uid}.txt", test_domain)
         assert r.status_code == 200
         data = r.json()
         doc_id = data["document"]["id"]
@@ -169,25 +214,37 @@ class TestDocumentCRUD:
         assert result["deleted"] is True
         assert result["children_deleted"] >= 0
 
-        # Verify children are gone
-        for cid in child_ids[:3]:  # Check first 3
-            r = await api_client.get(f"{API_BASE}/memory/{cid}")
-            assert r.status_code == 404
+        # Verify children are gone (check first 3)
+        results = await asyncio.gather(
+            *(api_client.get(f"{API_BASE}/memory/{cid}") for cid in child_ids[:3])
+        )
+        assert all(r.status_code == 404 for r in results)
 
 
+@pytest.mark.slow
 class TestDocumentCascadeOps:
-    """Test cascade pin/unpin and update operations."""
+    """Test cascade pin/unpin and update operations on a shared document.
 
-    @pytest.mark.slow
-    async def test_pin_cascade(self, api_client, cleanup):
+    Tests run in definition order: read-only checks first, then pin/unpin,
+    then the domain PATCH, which leaves the document in a new domain.
+    """
+
+    async def test_children_inherit_durability(self, api_client, sample_document):
+        """Children should inherit document durability at ingest time."""
+        child_ids = sample_document["child_ids"]
+
+        assert sample_document["document"]["durability"] == "permanent"
+
+        # Check a child's durability
+        if child_ids:
+            r = await api_client.get(f"{API_BASE}/memory/{child_ids[0]}")
+            if r.status_code == 200:
+                assert r.json().get("durability") == "permanent"
+
+    async def test_pin_cascade(self, api_client, sample_document):
         """Pin should cascade to all children."""
-        uid = uuid.uuid4().hex[:8]
-        content = f"Pin cascade test {uid}. Qdrant vector database stores embeddings."
-        r = await ingest_text(api_client, content, f"pin-{uid}.txt")
-        assert r.status_code == 200
-        doc_id = r.json()["document"]["id"]
-        child_ids = r.json()["child_ids"]
-        cleanup.track_document(doc_id)
+        doc_id = sample_document["document"]["id"]
+        child_ids = sample_document["child_ids"]
 
         # Pin
         r = await api_client.post(f"{API_BASE}/document/{doc_id}/pin")
@@ -200,15 +257,9 @@ class TestDocumentCascadeOps:
             if r.status_code == 200:
                 assert r.json().get("pinned") is True
 
-    @pytest.mark.slow
-    async def test_unpin_cascade(self, api_client, cleanup):
+    async def test_unpin_cascade(self, api_client, sample_document):
         """Unpin should cascade to all children."""
-        uid = uuid.uuid4().hex[:8]
-        content = f"Unpin cascade test {uid}. PostgreSQL handles audit logging."
-        r = await ingest_text(api_client, content, f"unpin-{uid}.txt")
-        assert r.status_code == 200
-        doc_id = r.json()["document"]["id"]
-        cleanup.track_document(doc_id)
+        doc_id = sample_document["document"]["id"]
 
         # Pin then unpin
         await api_client.post(f"{API_BASE}/document/{doc_id}/pin")
@@ -216,45 +267,14 @@ class TestDocumentCascadeOps:
         assert r.status_code == 200
         assert r.json()["pinned"] is False
 
-    @pytest.mark.slow
-    async def test_update_domain_cascades(self, api_client, cleanup):
+    async def test_update_domain_cascades(self, api_client, sample_document):
         """PATCH domain should cascade to children."""
-        uid = uuid.uuid4().hex[:8]
-        content = f"Domain update test {uid}. The worker processes background tasks via ARQ."
-        r = await ingest_text(api_client, content, f"domain-{uid}.txt")
-        assert r.status_code == 200
-        doc_id = r.json()["document"]["id"]
-        child_ids = r.json()["child_ids"]
-        cleanup.track_document(doc_id)
+        doc_id = sample_document["document"]["id"]
 
-        new_domain = f"updated-{uid}"
+        new_domain = f"updated-{uuid.uuid4().hex[:8]}"
         r = await api_client.patch(
             f"{API_BASE}/document/{doc_id}",
             json={"domain": new_domain},
         )
         assert r.status_code == 200
         assert r.json()["children_updated"] >= 0
-
-    @pytest.mark.slow
-    async def test_children_inherit_durability(self, api_client, cleanup):
-        """Children should inherit document durability at ingest time."""
-        uid = uuid.uuid4().hex[:8]
-        content = f"Durability inherit test {uid}. CasaOS runs at 192.168.50.19."
-        files = {"file": (f"dur-{uid}.txt", content.encode(), "text/plain")}
-        data = {"domain": "test-docs", "file_type": "text", "durability": "permanent"}
-        r = await request_with_retry(
-            api_client, "post", f"{API_BASE}/document/ingest",
-            files=files, data=data,
-        )
-        assert r.status_code == 200
-        doc_id = r.json()["document"]["id"]
-        child_ids = r.json()["child_ids"]
-        cleanup.track_document(doc_id)
-
-        assert r.json()["document"]["durability"] == "permanent"
-
-        # Check a child's durability
-        if child_ids:
-            r = await api_client.get(f"{API_BASE}/memory/{child_ids[0]}")
-            if r.status_code == 200:
-                assert r.json().get("durability") == "permanent"
@@ -2,14 +2,10 @@
 Tests for memory dynamics: access tracking, importance reinforcement.
 """
 
-import asyncio
-
 import pytest
 
 from tests.integration.conftest import API_BASE
 
-EMBED_DELAY = 0.5
-
 
 class TestAccessTracking:
     """Verify that searching for a memory increments its access_count."""
@@ -23,7 +19,6 @@ class TestAccessTracking:
             domain=test_domain,
         )
         mid = data["id"]
-        await asyncio.sleep(EMBED_DELAY)
 
         # GET should not increment
         r = await api_client.get(f"{API_BASE}/memory/{mid}")
@@ -32,9 +27,12 @@ class TestAccessTracking:
         # Search to trigger access tracking
         await api_client.post(
             f"{API_BASE}/search/query",
-            json={"query": "ALPHA-9876 access tracking", "domains": [test_domain]},
+            json={
+                "query": "ALPHA-9876 access tracking",
+                "domains": [test_domain],
+                "wait_for_tracking": True,
+            },
         )
-        await asyncio.sleep(0.3)
 
         r2 = await api_client.get(f"{API_BASE}/memory/{mid}")
         new_count = r2.json()["access_count"]
@@ -50,24 +48,24 @@ class TestAccessTracking:
             domain=test_domain,
         )
         mid = data["id"]
-        await asyncio.sleep(EMBED_DELAY)
 
         # Record initial importance
         r = await api_client.get(f"{API_BASE}/memory/{mid}")
         initial_importance = r.json()["importance"]
 
-        # Search multiple times
+        # Search multiple times, one after another: access tracking is a
+        # read-modify-write on the search-time snapshot, so concurrent
+        # searches would overwrite each other's boosts. wait_for_tracking
+        # makes each search return only after its write has landed.
+        payload = {
+            "query": "BETA-5432 importance reinforcement",
+            "domains": [test_domain],
+            "wait_for_tracking": True,
+        }
         for _ in range(5):
-            await api_client.post(
-                f"{API_BASE}/search/query",
-                json={
-                    "query": "BETA-5432 importance reinforcement",
-                    "domains": [test_domain],
-                },
-            )
-            await asyncio.sleep(0.2)
+            await api_client.post(f"{API_BASE}/search/query", json=payload)
 
-        # Check importance after repeated access
+        # Searches return only after their access writes, so read directly
         r2 = await api_client.get(f"{API_BASE}/memory/{mid}")
         final_importance = r2.json()["importance"]
 
@@ -89,23 +87,27 @@ class TestMonotonicImportance:
             domain=test_domain,
         )
         mid = data["id"]
-        await asyncio.sleep(EMBED_DELAY)
 
+        # Sequential on purpose: access tracking is a read-modify-write, so
+        # concurrent searches would lose increments (see test above).
+        # Check the invariant after searches 3, 6, 9 and 10 — a decrease
+        # anywhere in between still shows up at the next checkpoint
+        payload = {
+            "query": "GAMMA-1111 monotonic importance",
+            "domains": [test_domain],
+            "wait_for_tracking": True,
+        }
+        n_searches, checkpoint = 10, 3
         prev_importance = 0.3
-        for i in range(10):
-            await api_client.post(
-                f"{API_BASE}/search/query",
-                json={
-                    "query": "GAMMA-1111 monotonic importance",
-                    "domains": [test_domain],
-                },
-            )
-            await asyncio.sleep(0.2)
+        for i in range(1, n_searches + 1):
+            await api_client.post(f"{API_BASE}/search/query", json=payload)
+            if i % checkpoint and i != n_searches:
+                continue
 
             r = await api_client.get(f"{API_BASE}/memory/{mid}")
             current = r.json()["importance"]
             assert current >= prev_importance, (
-                f"Importance decreased at search {i+1}: {prev_importance} → {current}"
+                f"Importance decreased by search {i}: {prev_importance} → {current}"
             )
             prev_importance = current
 
@@ -123,7 +125,6 @@ class TestMonotonicImportance:
             domain=test_domain,
         )
         mid = data["id"]
-        await asyncio.sleep(EMBED_DELAY)
 
         n_searches = 3
         for _ in range(n_searches):
@@ -132,9 +133,9 @@ class TestMonotonicImportance:
                 json={
                     "query": "DELTA-2222 access counter",
                     "domains": [test_domain],
+                    "wait_for_tracking": True,
                 },
             )
-            await asyncio.sleep(0.2)
 
         r = await api_client.get(f"{API_BASE}/memory/{mid}")
         count = r.json()["access_count"]
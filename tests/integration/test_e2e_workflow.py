@@ -8,8 +8,6 @@ import pytest
 
 from tests.integration.conftest import API_BASE, request_with_retry
 
-EMBED_DELAY = 0.5
-
 
 @pytest.mark.slow
 class TestFullSessionWorkflow:
@@ -29,36 +27,37 @@ class TestFullSessionWorkflow:
         )
         sid = session["session_id"]
 
-        # 2. Store semantic facts during exploration
-        fact1 = await stored_memory(
-            "The auth module uses JWT with RS256 signing algorithm",
-            memory_type="semantic",
-            domain=test_domain,
-            tags=["auth", "jwt"],
-            session_id=sid,
-        )
-        fact2 = await stored_memory(
-            "Token refresh endpoint is POST /auth/refresh",
-            memory_type="semantic",
-            domain=test_domain,
-            tags=["auth", "api"],
-            session_id=sid,
-        )
-
-        # 3. Store episodic debug event
-        bug = await stored_memory(
-            "Found bug: refresh token not invalidated after password change",
-            memory_type="episodic",
-            domain=test_domain,
-            tags=["auth", "bug"],
-            session_id=sid,
-        )
-        fix = await stored_memory(
-            "Fixed by adding token revocation on password change in auth/service.py:88",
-            memory_type="episodic",
-            domain=test_domain,
-            tags=["auth", "fix"],
-            session_id=sid,
+        # 2–3. Store semantic facts and the episodic debug events — the four
+        # stores are independent, so issue them together
+        fact1, fact2, bug, fix = await asyncio.gather(
+            stored_memory(
+                "The auth module uses JWT with RS256 signing algorithm",
+                memory_type="semantic",
+                domain=test_domain,
+                tags=["auth", "jwt"],
+                session_id=sid,
+            ),
+            stored_memory(
+                "Token refresh endpoint is POST /auth/refresh",
+                memory_type="semantic",
+                domain=test_domain,
+                tags=["auth", "api"],
+                session_id=sid,
+            ),
+            stored_memory(
+                "Found bug: refresh token not invalidated after password change",
+                memory_type="episodic",
+                domain=test_domain,
+                tags=["auth", "bug"],
+                session_id=sid,
+            ),
+            stored_memory(
+                "Fixed by adding token revocation on password change in auth/service.py:88",
+                memory_type="episodic",
+                domain=test_domain,
+                tags=["auth", "fix"],
+                session_id=sid,
+            ),
         )
 
         # 4. Create relationship: bug → fix
@@ -72,35 +71,34 @@ class TestFullSessionWorkflow:
         )
         assert r.status_code == 200
 
-        await asyncio.sleep(EMBED_DELAY)
-
-        # 5. Search for related information
-        r = await request_with_retry(
-            api_client, "post",
-            f"{API_BASE}/search/query",
-            json={
-                "query": "auth token refresh bug",
-                "domains": [test_domain],
-                "session_id": sid,
-            },
+        # 5–6. Search for related information and assemble context
+        r_search, r_ctx = await asyncio.gather(
+            request_with_retry(
+                api_client, "post",
+                f"{API_BASE}/search/query",
+                json={
+                    "query": "auth token refresh bug",
+                    "domains": [test_domain],
+                    "session_id": sid,
+                },
+            ),
+            request_with_retry(
+                api_client, "post",
+                f"{API_BASE}/search/context",
+                json={
+                    "query": "authentication token handling",
+                    "session_id": sid,
+                    "include_working_memory": True,
+                    "max_tokens": 2000,
+                },
+            ),
         )
-        assert r.status_code == 200
-        results = r.json()["results"]
+        assert r_search.status_code == 200
+        results = r_search.json()["results"]
         assert len(results) >= 1
 
-        # 6. Assemble context
-        r = await request_with_retry(
-            api_client, "post",
-            f"{API_BASE}/search/context",
-            json={
-                "query": "authentication token handling",
-                "session_id": sid,
-                "include_working_memory": True,
-                "max_tokens": 2000,
-            },
-        )
-        assert r.status_code == 200
-        ctx = r.json()
+        assert r_ctx.status_code == 200
+        ctx = r_ctx.json()
         assert ctx["memories_used"] >= 1
         assert ctx["context"]  # Non-empty
 
@@ -132,20 +130,28 @@ class TestKnowledgeAccumulation:
             tags=["graphql", "performance"],
         )
         mid = data["id"]
-        await asyncio.sleep(EMBED_DELAY)
-
-        # Search repeatedly
-        for _ in range(5):
-            await api_client.post(
-                f"{API_BASE}/search/query",
-                json={
-                    "query": "GraphQL N+1 DataLoader",
-                    "domains": [test_domain],
-                },
-            )
-            await asyncio.sleep(0.2)
 
-        # Verify importance grew
+        # Search repeatedly, one at a time: access tracking is a
+        # read-modify-write on the search-time snapshot, so concurrent
+        # searches would lose boosts; wait_for_tracking orders the writes.
+        # The domain makes the query text unique so the first lookup is cold.
+        payload = {
+            "query": f"GraphQL N+1 DataLoader ({test_domain})",
+            "domains": [test_domain],
+            "wait_for_tracking": True,
+        }
+        first = await api_client.post(f"{API_BASE}/search/query", json=payload)
+        assert first.status_code == 200
+        repeats = [
+            await api_client.post(f"{API_BASE}/search/query", json=payload) for _ in range(4)
+        ]
+
+        # Servers without the embedding cache don't send X-Cache
+        if "x-cache" in first.headers:
+            assert first.headers["x-cache"] == "miss"
+            assert all(rr.headers["x-cache"] == "hit" for rr in repeats)
+
+        # Verify importance grew (searches returned after their access writes)
         r = await api_client.get(f"{API_BASE}/memory/{mid}")
         assert r.status_code == 200
         assert r.json()["importance"] >= 0.3
@@ -155,21 +161,22 @@ class TestKnowledgeAccumulation:
 class TestMultiDomainCrossReference:
     """Memories from different domains can be found in a single query."""
 
-    async def test_cross_domain_search(self, stored_memory, api_client, test_domain):
+    async def test_cross_domain_search(self, stored_memories_batch, api_client, test_domain):
         domain_a = test_domain + "-frontend"
         domain_b = test_domain + "-backend"
 
-        await stored_memory(
-            "React component uses fetch to call the user API",
-            domain=domain_a,
-            tags=["react", "api"],
-        )
-        await stored_memory(
-            "User API endpoint validates JWT before returning user data",
-            domain=domain_b,
-            tags=["api", "auth"],
-        )
-        await asyncio.sleep(EMBED_DELAY)
+        front, back = await stored_memories_batch([
+            {
+                "content": "React component uses fetch to call the user API",
+                "domain": domain_a,
+                "tags": ["react", "api"],
+            },
+            {
+                "content": "User API endpoint validates JWT before returning user data",
+                "domain": domain_b,
+                "tags": ["api", "auth"],
+            },
+        ])
 
         r = await request_with_retry(
             api_client, "post",
@@ -225,23 +232,22 @@ class TestSessionWorkingMemoryInContext:
     """Working memory from an active session should appear in context assembly."""
 
     async def test_working_memory_in_context(
-        self, active_session, stored_memory, api_client, test_domain
+        self, active_session, stored_memories_batch, api_client
     ):
         session = await active_session(current_task="refactoring database layer")
         sid = session["session_id"]
 
         # Store memories into the session
-        await stored_memory(
-            "Refactoring plan: extract repository pattern from service layer",
-            session_id=sid,
-            domain=test_domain,
-        )
-        await stored_memory(
-            "Found 12 direct SQL queries in user_service.py to migrate",
-            session_id=sid,
-            domain=test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
+        plan, finding = await stored_memories_batch([
+            {
+                "content": "Refactoring plan: extract repository pattern from service layer",
+                "session_id": sid,
+            },
+            {
+                "content": "Found 12 direct SQL queries in user_service.py to migrate",
+                "session_id": sid,
+            },
+        ])
 
         # Assemble context with working memory
         r = await api_client.post(
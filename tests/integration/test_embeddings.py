@@ -9,13 +9,77 @@ These tests verify that:
 - Embedding prefixes aid retrieval
 """
 
-import asyncio
+import uuid
 
 import pytest
-
-from tests.integration.conftest import API_BASE, request_with_retry
-
-EMBED_DELAY = 0.5
+import pytest_asyncio
+
+from tests.integration.conftest import (
+    API_BASE,
+    poll_until,
+    private_domain,
+    request_with_retry,
+    seeded_memories,
+)
+
+PYTHON_READABLE = "Python is a programming language known for readability"
+PYTHON_READABLE_PARAPHRASE = "Python is a coding language famous for being readable"
+PYTHON_SOFTWARE = "Python programming language for software development"
+CHOCOLATE_CAKE = "Chocolate cake recipe with buttercream frosting"
+DOCKER_TEXTS = [
+    "Docker containers provide process isolation and portability",
+    "Docker Compose orchestrates multi-container applications",
+    "Kubernetes manages Docker container deployments at scale",
+]
+COOKIE_RECIPE = "The best chocolate chip cookie recipe uses brown butter"
+POSTGRES_JSONB = "PostgreSQL supports JSONB columns for semi-structured data storage"
+
+_CORPUS = [
+    PYTHON_READABLE,
+    PYTHON_READABLE_PARAPHRASE,
+    PYTHON_SOFTWARE,
+    CHOCOLATE_CAKE,
+    *DOCKER_TEXTS,
+    COOKIE_RECIPE,
+    POSTGRES_JSONB,
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def embedded_corpus(_session_client):
+    """
+    Store every canonical text once so each is embedded once per module.
+
+    Each text carries a per-module hex marker so content-hash dedup can't
+    hand back a memory from another run or xdist worker. The marker is a
+    bare hex string rather than the domain name to keep its effect on the
+    embeddings small. Yields {"domain": str, "memories": {text: store response}},
+    keyed by the canonical (unmarked) text.
+    """
+    uid = uuid.uuid4().hex[:12]
+    domain = private_domain("embed")
+    payloads = [{"content": f"{text} [{uid}]", "domain": domain} for text in _CORPUS]
+    async with seeded_memories(_session_client, payloads) as stored:
+        for text, item in zip(_CORPUS, stored):
+            assert item["created"] is True, f"Corpus text deduplicated, not created: {text!r}"
+        yield {"domain": domain, "memories": dict(zip(_CORPUS, stored))}
+
+
+async def poll_similar(client, mid: str, expect_id: str, deadline: float = 2.0):
+    """GET /search/similar/{mid} until ``expect_id`` shows up or ``deadline`` passes.
+
+    Returns the last response; the caller asserts on it. Backs off rather
+    than polling at a fixed interval since the endpoint is rate-limited.
+    """
+    return await poll_until(
+        lambda: request_with_retry(
+            client, "get", f"{API_BASE}/search/similar/{mid}", params={"limit": 10}
+        ),
+        lambda resp: resp.status_code == 200
+        and any(s["id"] == expect_id for s in resp.json()["similar"]),
+        deadline=deadline,
+        initial=0.02,
+    )
 
 
 @pytest.mark.slow
@@ -31,26 +95,12 @@ class TestEmbeddings:
         cleanup.track_memory(data["id"])
         return data
 
-    async def test_similar_texts_score_high_similarity(
-        self, api_client, test_domain, cleanup
-    ):
+    async def test_similar_texts_score_high_similarity(self, api_client, embedded_corpus):
         """Two paraphrases of the same fact should have similarity > 0.8."""
-        m1 = await self._store_and_track(
-            api_client, cleanup,
-            "Python is a programming language known for readability",
-            test_domain,
-        )
-        m2 = await self._store_and_track(
-            api_client, cleanup,
-            "Python is a coding language famous for being readable",
-            test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
+        m1 = embedded_corpus["memories"][PYTHON_READABLE]
+        m2 = embedded_corpus["memories"][PYTHON_READABLE_PARAPHRASE]
 
-        r = await api_client.get(
-            f"{API_BASE}/search/similar/{m1['id']}",
-            params={"limit": 10},
-        )
+        r = await poll_similar(api_client, m1["id"], m2["id"])
         assert r.status_code == 200
         similar = r.json()["similar"]
 
@@ -63,25 +113,15 @@ class TestEmbeddings:
             f"Expected similarity > 0.8, got {match['similarity']}"
         )
 
-    async def test_dissimilar_texts_score_low(
-        self, api_client, test_domain, cleanup
-    ):
+    async def test_dissimilar_texts_score_low(self, api_client, embedded_corpus):
         """Unrelated topics should have similarity < 0.5."""
-        m1 = await self._store_and_track(
-            api_client, cleanup,
-            "Python programming language for software development",
-            test_domain,
-        )
-        m2 = await self._store_and_track(
-            api_client, cleanup,
-            "Chocolate cake recipe with buttercream frosting",
-            test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
+        m1 = embedded_corpus["memories"][PYTHON_SOFTWARE]
+        m2 = embedded_corpus["memories"][CHOCOLATE_CAKE]
 
-        r = await api_client.get(
-            f"{API_BASE}/search/similar/{m1['id']}",
-            params={"limit": 10},
+        # The cake may legitimately never appear, so wait on the paraphrase
+        # from the same corpus to know the index has caught up
+        r = await poll_similar(
+            api_client, m1["id"], embedded_corpus["memories"][PYTHON_READABLE]["id"]
         )
         assert r.status_code == 200
         similar = r.json()["similar"]
@@ -92,32 +132,16 @@ class TestEmbeddings:
                 f"Expected similarity < 0.5 for unrelated texts, got {match['similarity']}"
             )
 
-    async def test_search_relevance_matches_semantic_meaning(
-        self, api_client, test_domain, cleanup
-    ):
+    async def test_search_relevance_matches_semantic_meaning(self, api_client, embedded_corpus):
         """Docker-related memories should dominate search for 'container orchestration'."""
-        docker_texts = [
-            "Docker containers provide process isolation and portability",
-            "Docker Compose orchestrates multi-container applications",
-            "Kubernetes manages Docker container deployments at scale",
-        ]
-        cooking_text = "The best chocolate chip cookie recipe uses brown butter"
-
-        for text in docker_texts:
-            await self._store_and_track(
-                api_client, cleanup, text, test_domain,
-            )
-        await self._store_and_track(
-            api_client, cleanup, cooking_text, test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
+        domain = embedded_corpus["domain"]
 
         r = await request_with_retry(
             api_client, "post",
             f"{API_BASE}/search/query",
             json={
                 "query": "container orchestration",
-                "domains": [test_domain],
+                "domains": [domain],
                 "limit": 5,
             },
         )
@@ -157,22 +181,17 @@ class TestEmbeddings:
         assert m2["created"] is False
 
     async def test_embedding_retrieves_despite_different_phrasing(
-        self, api_client, test_domain, cleanup
+        self, api_client, embedded_corpus
     ):
         """A stored fact should be findable even with very different query phrasing."""
-        await self._store_and_track(
-            api_client, cleanup,
-            "PostgreSQL supports JSONB columns for semi-structured data storage",
-            test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
+        domain = embedded_corpus["domain"]
 
         r = await request_with_retry(
             api_client, "post",
             f"{API_BASE}/search/query",
             json={
                 "query": "database with JSON support",
-                "domains": [test_domain],
+                "domains": [domain],
                 "limit": 5,
             },
         )
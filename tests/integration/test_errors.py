@@ -2,96 +2,61 @@
 Tests for error handling and validation (422 / 400 responses).
 """
 
+import asyncio
+
 import pytest
 
 from tests.integration.conftest import API_BASE
 
-
-class TestStoreValidation:
-    """POST /memory/store — validation errors."""
-
-    async def test_missing_content_field(self, api_client):
-        """content is required."""
-        r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"domain": "test"},
-        )
-        assert r.status_code == 422
-
-    async def test_invalid_memory_type(self, api_client):
-        """Invalid enum value for memory_type."""
-        r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"content": "test", "memory_type": "nonexistent_type"},
-        )
-        assert r.status_code == 422
-
-    async def test_invalid_source(self, api_client):
-        """Invalid enum value for source."""
-        r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"content": "test", "source": "alien"},
-        )
+# (endpoint, payload) pairs that must fail request validation with 422
+VALIDATION_CASES = {
+    # POST /memory/store
+    "missing_content_field": ("/memory/store", {"domain": "test"}),
+    "invalid_memory_type": (
+        "/memory/store",
+        {"content": "test", "memory_type": "nonexistent_type"},
+    ),
+    "invalid_source": ("/memory/store", {"content": "test", "source": "alien"}),
+    "importance_out_of_range_high": ("/memory/store", {"content": "test", "importance": 1.5}),
+    "importance_out_of_range_low": ("/memory/store", {"content": "test", "importance": -0.1}),
+    "confidence_out_of_range": ("/memory/store", {"content": "test", "confidence": 2.0}),
+    # POST /memory/relationship
+    "invalid_relationship_type": (
+        "/memory/relationship",
+        {"source_id": "a", "target_id": "b", "relationship_type": "loves"},
+    ),
+    "missing_source_id": (
+        "/memory/relationship",
+        {"target_id": "b", "relationship_type": "related_to"},
+    ),
+    "missing_target_id": (
+        "/memory/relationship",
+        {"source_id": "a", "relationship_type": "related_to"},
+    ),
+}
+
+
+@pytest.mark.xdist_group("readonly")
+class TestRequestValidation:
+    """POST /memory/store and /memory/relationship — validation errors."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "payload"), VALIDATION_CASES.values(), ids=VALIDATION_CASES.keys()
+    )
+    async def test_validation_rejects(self, api_client, endpoint, payload):
+        r = await api_client.post(f"{API_BASE}{endpoint}", json=payload)
         assert r.status_code == 422
 
-    async def test_importance_out_of_range_high(self, api_client):
-        """importance > 1.0 should fail validation."""
-        r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"content": "test", "importance": 1.5},
+    async def test_all_validation_errors_concurrently(self, api_client):
+        """Smoke check: every case still 422s when fired in one round."""
+        responses = await asyncio.gather(
+            *(
+                api_client.post(f"{API_BASE}{endpoint}", json=payload)
+                for endpoint, payload in VALIDATION_CASES.values()
+            )
         )
-        assert r.status_code == 422
-
-    async def test_importance_out_of_range_low(self, api_client):
-        """importance < 0.0 should fail validation."""
-        r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"content": "test", "importance": -0.1},
-        )
-        assert r.status_code == 422
-
-    async def test_confidence_out_of_range(self, api_client):
-        """confidence > 1.0 should fail validation."""
-        r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"content": "test", "confidence": 2.0},
-        )
-        assert r.status_code == 422
-
-
-class TestRelationshipValidation:
-    """POST /memory/relationship — validation errors."""
-
-    async def test_invalid_relationship_type(self, api_client):
-        r = await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "source_id": "a",
-                "target_id": "b",
-                "relationship_type": "loves",
-            },
-        )
-        assert r.status_code == 422
-
-    async def test_missing_source_id(self, api_client):
-        r = await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "target_id": "b",
-                "relationship_type": "related_to",
-            },
-        )
-        assert r.status_code == 422
-
-    async def test_missing_target_id(self, api_client):
-        r = await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "source_id": "a",
-                "relationship_type": "related_to",
-            },
-        )
-        assert r.status_code == 422
+        statuses = dict(zip(VALIDATION_CASES, (r.status_code for r in responses)))
+        assert all(code == 422 for code in statuses.values()), statuses
 
 
 class TestSearchValidation:
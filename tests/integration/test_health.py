@@ -2,22 +2,38 @@
 Tests for /health and /stats endpoints.
 """
 
+import pytest
+import pytest_asyncio
+
 from tests.integration.conftest import API_BASE
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def health_payload(_session_client):
+    """Fetch /health once for the class — returns (status_code, body)."""
+    r = await _session_client.get(f"{API_BASE}/health")
+    return r.status_code, r.json()
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def stats_payload(_session_client):
+    """Fetch /stats once for the class — returns (status_code, body)."""
+    r = await _session_client.get(f"{API_BASE}/stats")
+    return r.status_code, r.json()
+
+
+@pytest.mark.xdist_group("readonly")
 class TestHealth:
     """Health check endpoint tests."""
 
-    async def test_health_returns_healthy(self, api_client):
-        r = await api_client.get(f"{API_BASE}/health")
-        assert r.status_code == 200
-        data = r.json()
+    async def test_health_returns_healthy(self, health_payload):
+        status_code, data = health_payload
+        assert status_code == 200
         assert data["status"] in ("healthy", "degraded")
         assert "timestamp" in data
 
-    async def test_health_includes_service_checks(self, api_client):
-        r = await api_client.get(f"{API_BASE}/health")
-        data = r.json()
+    async def test_health_includes_service_checks(self, health_payload):
+        _, data = health_payload
         checks = data["checks"]
         assert "api" in checks
         assert "qdrant" in checks
@@ -27,10 +43,9 @@ class TestHealth:
         for service, status in checks.items():
             assert "ok" in str(status), f"{service} check not ok: {status}"
 
-    async def test_stats_returns_counts(self, api_client):
-        r = await api_client.get(f"{API_BASE}/stats")
-        assert r.status_code == 200
-        data = r.json()
+    async def test_stats_returns_counts(self, stats_payload):
+        status_code, data = stats_payload
+        assert status_code == 200
 
         assert "memories" in data
         assert "total" in data["memories"]
@@ -6,96 +6,131 @@ and conflict detection system.
 """
 
 import asyncio
-import os
-import uuid
 
-import pytest
+import pytest_asyncio
+from pydantic import BaseModel, ConfigDict
 
 from tests.integration.conftest import request_with_retry
 
-API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
+
+class _Section(BaseModel):
+    # Only the fields the tests assert on are declared; the rest pass through.
+    # strict: no coercion, so "true" or 1 won't pass as a bool, nor "5" as an int
+    model_config = ConfigDict(extra="allow", strict=True)
+
+
+class FeedbackSection(_Section):
+    positive_rate: float
+    total_positive: int
+    total_negative: int
+    daily: list
+
+
+class PinsSection(_Section):
+    pinned: int
+    total: int
+    ratio: float
+    warning: bool
+
+
+class ImportanceBand(_Section):
+    range: str
+    count: int
+
+
+class DashboardResponse(_Section):
+    generated_at: str
+    feedback: FeedbackSection
+    population: dict
+    graph: dict
+    pins: PinsSection
+    importance_distribution: list[ImportanceBand]
+    feedback_similarity: object
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def dashboard_payload(_session_client):
+    """Fetch the health dashboard once for the module — returns (status_code, body, etag).
+
+    The body is validated into a DashboardResponse here, once, so a missing
+    or mistyped field fails every dependent test with the same error.
+    """
+    r = await _session_client.get("/admin/health/dashboard")
+    body = DashboardResponse.model_validate(r.json()) if r.status_code == 200 else None
+    return r.status_code, body, r.headers.get("ETag")
 
 
 class TestHealthDashboard:
     """Test the health dashboard endpoint."""
 
-    async def test_dashboard_returns_all_sections(self, api_client):
+    async def test_dashboard_returns_all_sections(self, dashboard_payload):
         """Dashboard should return all expected sections."""
-        r = await api_client.get(f"{API_BASE}/admin/health/dashboard")
-        assert r.status_code == 200
-        data = r.json()
+        status_code, data, _ = dashboard_payload
+        assert status_code == 200
+        # Section presence and types are checked by DashboardResponse
+        assert data.generated_at
 
-        assert "generated_at" in data
-        assert "feedback" in data
-        assert "population" in data
-        assert "graph" in data
-        assert "pins" in data
-        assert "importance_distribution" in data
-        assert "feedback_similarity" in data
-
-    async def test_dashboard_feedback_structure(self, api_client):
+    async def test_dashboard_feedback_structure(self, dashboard_payload):
         """Feedback section should have the expected fields."""
-        r = await api_client.get(f"{API_BASE}/admin/health/dashboard")
-        assert r.status_code == 200
-        feedback = r.json()["feedback"]
+        status_code, data, _ = dashboard_payload
+        assert status_code == 200
+        feedback = data.feedback
 
-        assert "positive_rate" in feedback
-        assert "total_positive" in feedback
-        assert "total_negative" in feedback
-        assert "daily" in feedback
-        assert isinstance(feedback["daily"], list)
+        assert 0.0 <= feedback.positive_rate <= 1.0
+        assert feedback.total_positive >= 0
+        assert feedback.total_negative >= 0
 
     async def test_dashboard_cached(self, api_client):
         """Dashboard should be cached (same generated_at within 5min)."""
-        r1 = await api_client.get(f"{API_BASE}/admin/health/dashboard")
+        # Concurrent on purpose: cold-cache recomputes are single-flight,
+        # so both requests must see the same payload even if neither hits
+        r1, r2 = await asyncio.gather(
+            api_client.get("/admin/health/dashboard"),
+            api_client.get("/admin/health/dashboard"),
+        )
         assert r1.status_code == 200
-        ts1 = r1.json()["generated_at"]
-
-        r2 = await api_client.get(f"{API_BASE}/admin/health/dashboard")
         assert r2.status_code == 200
-        ts2 = r2.json()["generated_at"]
 
         # Cached response should have same timestamp
-        assert ts1 == ts2
+        assert r1.json()["generated_at"] == r2.json()["generated_at"]
 
-    async def test_pin_ratio_computed(self, api_client):
+    async def test_dashboard_conditional_get(self, api_client, dashboard_payload):
+        """Revalidating with the module's ETag should return a bodiless 304."""
+        _, _, etag = dashboard_payload
+        assert etag is not None, "dashboard response is missing its ETag"
+
+        r = await api_client.get(
+            "/admin/health/dashboard", headers={"If-None-Match": etag}
+        )
+        assert r.status_code == 304
+        assert r.content == b""
+
+    async def test_pin_ratio_computed(self, dashboard_payload):
         """Pin ratio should be computed correctly."""
-        r = await api_client.get(f"{API_BASE}/admin/health/dashboard")
-        assert r.status_code == 200
-        pins = r.json()["pins"]
+        status_code, data, _ = dashboard_payload
+        assert status_code == 200
+        pins = data.pins
 
-        assert "pinned" in pins
-        assert "total" in pins
-        assert "ratio" in pins
-        assert "warning" in pins
-        assert isinstance(pins["warning"], bool)
-        assert pins["total"] >= 0
-        assert 0.0 <= pins["ratio"] <= 1.0
+        assert pins.total >= 0
+        assert 0.0 <= pins.ratio <= 1.0
 
-    async def test_importance_distribution_has_bands(self, api_client):
+    async def test_importance_distribution_has_bands(self, dashboard_payload):
         """Importance distribution should have 5 bands."""
-        r = await api_client.get(f"{API_BASE}/admin/health/dashboard")
-        assert r.status_code == 200
-        bands = r.json()["importance_distribution"]
-
-        assert isinstance(bands, list)
-        assert len(bands) == 5
-        for band in bands:
-            assert "range" in band
-            assert "count" in band
+        status_code, data, _ = dashboard_payload
+        assert status_code == 200
+        # Each band's range/count was validated with the model
+        assert len(data.importance_distribution) == 5
 
 
 class TestForceProfile:
     """Test the per-memory force profile endpoint."""
 
     async def test_force_profile_for_existing_memory(
-        self, api_client, stored_memory, cleanup
+        self, api_client, stored_memory, cleanup, uid
     ):
         """Force profile should return all forces for a valid memory."""
-        mem = await stored_memory(
-            f"Force profile test memory {uuid.uuid4().hex[:8]}"
-        )
-        r = await api_client.get(f"{API_BASE}/memory/{mem['id']}/forces")
+        mem = await stored_memory(f"Force profile test memory {uid}")
+        r = await api_client.get(f"/memory/{mem['id']}/forces")
         assert r.status_code == 200
         data = r.json()
 
@@ -113,16 +148,19 @@ class TestForceProfile:
         assert "durability_shield" in forces
 
     async def test_pinned_memory_zero_decay(
-        self, api_client, stored_memory, cleanup
+        self, api_client, stored_memory, cleanup, uid
     ):
         """Pinned memory should have zero decay pressure and pin force 1.0."""
         mem = await stored_memory(
-            f"Pinned force test {uuid.uuid4().hex[:8]}",
+            f"Pinned force test {uid}",
             importance=0.8,
         )
-        await api_client.post(f"{API_BASE}/memory/{mem['id']}/pin")
+        # The forces read depends on the pin write, so the two stay sequential;
+        # they share the session client's pooled connection
+        pin = await api_client.post(f"/memory/{mem['id']}/pin")
+        assert pin.status_code == 200
 
-        r = await api_client.get(f"{API_BASE}/memory/{mem['id']}/forces")
+        r = await api_client.get(f"/memory/{mem['id']}/forces")
         assert r.status_code == 200
         forces = r.json()["forces"]
 
@@ -132,7 +170,7 @@ class TestForceProfile:
     async def test_force_profile_nonexistent_404(self, api_client):
         """Force profile for nonexistent memory should 404."""
         r = await api_client.get(
-            f"{API_BASE}/memory/00000000-0000-0000-0000-000000000000/forces"
+            "/memory/00000000-0000-0000-0000-000000000000/forces"
         )
         assert r.status_code == 404
 
@@ -142,7 +180,7 @@ class TestConflicts:
 
     async def test_conflicts_returns_list(self, api_client):
         """Conflicts endpoint should return a list structure."""
-        r = await api_client.get(f"{API_BASE}/admin/conflicts")
+        r = await api_client.get("/admin/conflicts")
         assert r.status_code == 200
         data = r.json()
 
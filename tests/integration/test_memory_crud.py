@@ -2,11 +2,16 @@
 Tests for memory CRUD operations: POST /memory/store, GET /memory/{id}, DELETE /memory/{id}.
 """
 
+import asyncio
 import hashlib
 
 import pytest
 
-from tests.integration.conftest import API_BASE
+
+def _content_hash(text: str) -> str:
+    """Mirror of src.core.embeddings.content_hash, computed client-side."""
+    normalized = " ".join(text.lower().split())
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
 
 class TestStoreMemory:
@@ -15,7 +20,7 @@ class TestStoreMemory:
     async def test_store_minimal(self, api_client, test_domain, cleanup):
         """Store with only content — defaults should fill in."""
         r = await api_client.post(
-            f"{API_BASE}/memory/store",
+            "/memory/store",
             json={"content": "minimal memory", "domain": test_domain},
         )
         assert r.status_code == 200
@@ -41,24 +46,44 @@ class TestStoreMemory:
         assert data["created"] is True
         assert data["id"]
 
-    @pytest.mark.parametrize("mtype", ["semantic", "episodic", "procedural", "working"])
-    async def test_store_each_memory_type(self, stored_memory, mtype):
+    async def test_store_each_memory_type(self, stored_memory):
         """Store succeeds for every MemoryType enum value."""
-        data = await stored_memory(f"memory of type {mtype}", memory_type=mtype)
-        assert data["created"] is True
+        mtypes = ("semantic", "episodic", "procedural", "working")
+        results = await asyncio.gather(
+            *(stored_memory(f"memory of type {mtype}", memory_type=mtype) for mtype in mtypes),
+            return_exceptions=True,
+        )
+        for mtype, data in zip(mtypes, results):
+            if isinstance(data, BaseException):
+                pytest.fail(f"store failed for memory_type={mtype}: {data}")
+            assert data["created"] is True, f"memory_type={mtype} was not created"
 
-    async def test_content_hash_deterministic(self, api_client, test_domain, cleanup):
-        """Same content produces the same hash."""
+    async def test_content_hash_matches_local(self, api_client, test_domain, cleanup):
+        """The server hash is the documented content_hash of the content."""
         content = f"deterministic hash test {test_domain}"
+        r = await api_client.post(
+            "/memory/store",
+            json={"content": content, "domain": test_domain},
+        )
+        assert r.status_code == 200
+        data = r.json()
+        cleanup.track_memory(data["id"])
+
+        assert data["content_hash"] == _content_hash(content)
+
+    @pytest.mark.slow
+    async def test_content_hash_deterministic(self, api_client, test_domain, cleanup):
+        """Same content produces the same hash (full two-store round trip)."""
+        content = f"deterministic hash round trip {test_domain}"
         r1 = await api_client.post(
-            f"{API_BASE}/memory/store",
+            "/memory/store",
             json={"content": content, "domain": test_domain},
         )
         data1 = r1.json()
         cleanup.track_memory(data1["id"])
 
         r2 = await api_client.post(
-            f"{API_BASE}/memory/store",
+            "/memory/store",
             json={"content": content, "domain": test_domain},
         )
         data2 = r2.json()
@@ -66,35 +91,32 @@ class TestStoreMemory:
 
         assert data1["content_hash"] == data2["content_hash"]
 
-    async def test_content_hash_unique_for_different_content(self, stored_memory):
+    async def test_content_hash_unique_for_different_content(self, bulk_seed):
         """Different content produces different hashes."""
-        d1 = await stored_memory("alpha content unique")
-        d2 = await stored_memory("beta content unique")
+        d1 = bulk_seed["memories"]["alpha"]
+        d2 = bulk_seed["memories"]["beta"]
         assert d1["content_hash"] != d2["content_hash"]
 
-    async def test_default_values_applied(self, api_client, test_domain, cleanup):
+    async def test_default_values_applied(self, api_client, test_domain, cleanup, uid):
         """Verify defaults: semantic type, 0.5 importance, 0.8 confidence."""
         r = await api_client.post(
-            f"{API_BASE}/memory/store",
-            json={"content": "defaults test", "domain": test_domain},
+            "/memory/store",
+            json={"content": f"defaults test {uid}", "domain": test_domain},
         )
+        assert r.status_code == 200
         data = r.json()
         cleanup.track_memory(data["id"])
+        # A dedup hit would echo some other memory's values
+        assert data["created"] is True
 
-        # Fetch the stored memory to inspect defaults
-        r2 = await api_client.get(f"{API_BASE}/memory/{data['id']}")
-        assert r2.status_code == 200
-        mem = r2.json()
-        assert mem["memory_type"] == "semantic"
-        assert mem["importance"] == pytest.approx(0.5, abs=0.01)
-        assert mem["confidence"] == pytest.approx(0.8, abs=0.01)
+        # The store response echoes the values as stored, defaults applied
+        assert data["memory_type"] == "semantic"
+        assert data["importance"] == pytest.approx(0.5, abs=0.01)
+        assert data["confidence"] == pytest.approx(0.8, abs=0.01)
 
-    async def test_metadata_stored(self, stored_memory, api_client):
+    async def test_metadata_stored(self, bulk_seed):
         """Custom metadata round-trips through store→get."""
-        data = await stored_memory(
-            "metadata carrier",
-            metadata={"project": "recall", "version": 2},
-        )
+        data = bulk_seed["memories"]["metadata"]
         # The GET response model doesn't include metadata directly,
         # but the store should succeed without error
         assert data["created"] is True
@@ -103,35 +125,36 @@ class TestStoreMemory:
 class TestGetMemory:
     """GET /memory/{memory_id}"""
 
-    async def test_get_by_id(self, stored_memory, api_client):
-        data = await stored_memory("retrievable memory")
-        r = await api_client.get(f"{API_BASE}/memory/{data['id']}")
+    async def test_get_by_id(self, bulk_seed, api_client):
+        data = bulk_seed["memories"]["retrievable"]
+        r = await api_client.get(f"/memory/{data['id']}")
         assert r.status_code == 200
         mem = r.json()
         assert mem["id"] == data["id"]
-        assert mem["content"] == "retrievable memory"
+        assert mem["content"] == data["content"]
         assert "created_at" in mem
         assert "last_accessed" in mem
         assert mem["access_count"] >= 0
 
     async def test_get_not_found(self, api_client):
-        r = await api_client.get(f"{API_BASE}/memory/nonexistent-id-000")
+        r = await api_client.get("/memory/nonexistent-id-000")
         assert r.status_code == 404
 
 
 class TestDeleteMemory:
     """DELETE /memory/{memory_id}"""
 
-    async def test_delete_and_verify_gone(self, stored_memory, api_client):
+    async def test_delete_and_verify_gone(self, stored_memory, api_client, cleanup):
         data = await stored_memory("ephemeral memory")
         mid = data["id"]
 
-        r = await api_client.delete(f"{API_BASE}/memory/{mid}")
+        r = await api_client.delete(f"/memory/{mid}")
         assert r.status_code == 200
+        cleanup.untrack_memory(mid)
         body = r.json()
         assert body["deleted"] is True
         assert body["id"] == mid
 
-        # Confirm it's gone
-        r2 = await api_client.get(f"{API_BASE}/memory/{mid}")
+        # Confirm it's gone (HEAD: only the status matters)
+        r2 = await api_client.head(f"/memory/{mid}")
         assert r2.status_code == 404
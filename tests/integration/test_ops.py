@@ -4,13 +4,14 @@ Integration tests for Phase 7 — Observability & Operations.
 Tests: export, import, reconcile, metrics, dashboard.
 """
 
-import json
+import asyncio
 import uuid
 
 import httpx
 import pytest
+import pytest_asyncio
 
-from .conftest import API_BASE
+from .conftest import encode_jsonl, iter_jsonl
 
 pytestmark = pytest.mark.asyncio
 
@@ -20,13 +21,28 @@ pytestmark = pytest.mark.asyncio
 # =============================================================
 
 
-async def test_metrics_endpoint(api_client: httpx.AsyncClient):
-    """GET /metrics returns Prometheus text format."""
-    r = await api_client.get(f"{API_BASE}/metrics")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def metrics_map(_session_client):
+    """Fetch /metrics once and parse it into {metric family: type}.
+
+    The exposition is hand-rolled (src/core/metrics.py), so a scan of the
+    ``# TYPE`` lines is all the parsing needed; tests look names up in the
+    map instead of each re-scanning the text.
+    """
+    r = await _session_client.get("/metrics")
     assert r.status_code == 200
-    text = r.text
-    assert "recall_uptime_seconds" in text
-    assert "# TYPE" in text
+    families = {}
+    for line in r.text.splitlines():
+        if line.startswith("# TYPE "):
+            name, _, kind = line[len("# TYPE "):].partition(" ")
+            families[name] = kind
+    return families
+
+
+async def test_metrics_endpoint(metrics_map):
+    """GET /metrics returns Prometheus text format."""
+    assert metrics_map, "no # TYPE lines in /metrics"
+    assert metrics_map.get("recall_uptime_seconds") == "gauge"
 
 
 # =============================================================
@@ -36,7 +52,7 @@ async def test_metrics_endpoint(api_client: httpx.AsyncClient):
 
 async def test_dashboard_loads(api_client: httpx.AsyncClient):
     """GET /dashboard/ returns the React SPA HTML."""
-    r = await api_client.get(f"{API_BASE}/dashboard/", follow_redirects=True)
+    r = await api_client.get("/dashboard/", follow_redirects=True)
     assert r.status_code == 200
     assert "text/html" in r.headers.get("content-type", "")
     assert "Recall Dashboard" in r.text
@@ -47,47 +63,42 @@ async def test_dashboard_loads(api_client: httpx.AsyncClient):
 # =============================================================
 
 
-async def test_export_returns_jsonl(api_client: httpx.AsyncClient, stored_memory, test_domain):
+async def test_export_returns_jsonl(api_client: httpx.AsyncClient, bulk_seed):
     """Export produces valid JSONL with memory data."""
-    mem = await stored_memory("Export test memory for ops", domain=test_domain)
+    mem = bulk_seed["memories"]["export"]
 
-    r = await api_client.get(f"{API_BASE}/admin/export")
-    assert r.status_code == 200
-    assert "application/x-ndjson" in r.headers.get("content-type", "")
-
-    lines = [l for l in r.text.strip().split("\n") if l.strip()]
-    assert len(lines) >= 1
-
-    # Find our memory in the export
+    # Stream the export and stop at our memory instead of buffering it all
     found = False
-    for line in lines:
-        record = json.loads(line)
-        assert "memory" in record
-        assert "relationships" in record
-        if record["memory"]["id"] == mem["id"]:
-            found = True
-            assert record["memory"]["domain"] == test_domain
-            # No embedding by default
-            assert "embedding" not in record
+    async with api_client.stream("GET", "/admin/export") as r:
+        assert r.status_code == 200
+        assert "application/x-ndjson" in r.headers.get("content-type", "")
+
+        async for record in iter_jsonl(r):
+            assert "memory" in record
+            assert "relationships" in record
+            if record["memory"]["id"] == mem["id"]:
+                found = True
+                assert record["memory"]["domain"] == bulk_seed["domain"]
+                # No embedding by default
+                assert "embedding" not in record
+                break
     assert found, "Exported memory not found in JSONL"
 
 
-async def test_export_with_embeddings(api_client: httpx.AsyncClient, stored_memory, test_domain):
+async def test_export_with_embeddings(api_client: httpx.AsyncClient, bulk_seed):
     """Export with include_embeddings=true includes embedding vectors."""
-    mem = await stored_memory("Embedding export test", domain=test_domain)
+    mem = bulk_seed["memories"]["export_embedding"]
 
-    r = await api_client.get(f"{API_BASE}/admin/export?include_embeddings=true")
-    assert r.status_code == 200
-
-    lines = [l for l in r.text.strip().split("\n") if l.strip()]
     found = False
-    for line in lines:
-        record = json.loads(line)
-        if record["memory"]["id"] == mem["id"]:
-            found = True
-            assert "embedding" in record
-            assert isinstance(record["embedding"], list)
-            assert len(record["embedding"]) > 0
+    async with api_client.stream("GET", "/admin/export?include_embeddings=true") as r:
+        assert r.status_code == 200
+        async for record in iter_jsonl(r):
+            if record["memory"]["id"] == mem["id"]:
+                found = True
+                assert "embedding" in record
+                assert isinstance(record["embedding"], list)
+                assert len(record["embedding"]) > 0
+                break
     assert found, "Exported memory with embedding not found"
 
 
@@ -101,29 +112,24 @@ async def test_import_creates_memories(api_client: httpx.AsyncClient, stored_mem
     mem = await stored_memory("Round trip import test", domain=test_domain)
     mem_id = mem["id"]
 
-    # Export with embeddings so we can re-import without regenerating
-    r = await api_client.get(f"{API_BASE}/admin/export?include_embeddings=true")
-    assert r.status_code == 200
-
-    # Find our memory line
-    our_line = None
-    for line in r.text.strip().split("\n"):
-        if not line.strip():
-            continue
-        record = json.loads(line)
-        if record["memory"]["id"] == mem_id:
-            our_line = line
-            break
-    assert our_line, "Memory not found in export"
+    # Export with embeddings so we can re-import without regenerating;
+    # stream it and stop at our memory's record
+    our_record = None
+    async with api_client.stream("GET", "/admin/export?include_embeddings=true") as r:
+        assert r.status_code == 200
+        async for record in iter_jsonl(r):
+            if record["memory"]["id"] == mem_id:
+                our_record = record
+                break
+    assert our_record, "Memory not found in export"
 
     # Delete the original
-    dr = await api_client.delete(f"{API_BASE}/memory/{mem_id}")
+    dr = await api_client.delete(f"/memory/{mem_id}")
     assert dr.status_code == 200
 
     # Import it back
-    import_file = our_line.encode("utf-8")
-    files = {"file": ("test.jsonl", import_file, "application/x-ndjson")}
-    ir = await api_client.post(f"{API_BASE}/admin/import", files=files)
+    files = {"file": ("test.jsonl", encode_jsonl([our_record]), "application/x-ndjson")}
+    ir = await api_client.post("/admin/import", files=files)
     assert ir.status_code == 200
     data = ir.json()
     assert data["imported"] == 1
@@ -133,7 +139,7 @@ async def test_import_creates_memories(api_client: httpx.AsyncClient, stored_mem
     cleanup.track_memory(mem_id)
 
     # Verify it exists
-    vr = await api_client.get(f"{API_BASE}/memory/{mem_id}")
+    vr = await api_client.get(f"/memory/{mem_id}")
     assert vr.status_code == 200
 
 
@@ -142,7 +148,7 @@ async def test_import_skip_duplicates(api_client: httpx.AsyncClient, stored_memo
     mem = await stored_memory("Skip duplicate test", domain=test_domain)
 
     # Build a JSONL line for the same ID
-    line = json.dumps({
+    body = encode_jsonl([{
         "memory": {
             "id": mem["id"],
             "content": "OVERWRITTEN CONTENT",
@@ -150,17 +156,17 @@ async def test_import_skip_duplicates(api_client: httpx.AsyncClient, stored_memo
             "domain": test_domain,
         },
         "relationships": [],
-    })
+    }])
 
-    files = {"file": ("test.jsonl", line.encode(), "application/x-ndjson")}
-    r = await api_client.post(f"{API_BASE}/admin/import?conflict=skip", files=files)
+    files = {"file": ("test.jsonl", body, "application/x-ndjson")}
+    r = await api_client.post("/admin/import?conflict=skip", files=files)
     assert r.status_code == 200
     data = r.json()
     assert data["skipped"] == 1
     assert data["imported"] == 0
 
     # Original content unchanged
-    vr = await api_client.get(f"{API_BASE}/memory/{mem['id']}")
+    vr = await api_client.get(f"/memory/{mem['id']}")
     assert vr.status_code == 200
     assert "Skip duplicate test" in vr.json().get("content", "")
 
@@ -169,7 +175,7 @@ async def test_import_overwrite_mode(api_client: httpx.AsyncClient, stored_memor
     """Import with conflict=overwrite replaces existing memories."""
     mem = await stored_memory("Original content here", domain=test_domain)
 
-    line = json.dumps({
+    body = encode_jsonl([{
         "memory": {
             "id": mem["id"],
             "content": "Overwritten content here",
@@ -177,11 +183,11 @@ async def test_import_overwrite_mode(api_client: httpx.AsyncClient, stored_memor
             "domain": test_domain,
         },
         "relationships": [],
-    })
+    }])
 
-    files = {"file": ("test.jsonl", line.encode(), "application/x-ndjson")}
+    files = {"file": ("test.jsonl", body, "application/x-ndjson")}
     r = await api_client.post(
-        f"{API_BASE}/admin/import?conflict=overwrite&regenerate_embeddings=true",
+        "/admin/import?conflict=overwrite&regenerate_embeddings=true",
         files=files,
     )
     assert r.status_code == 200
@@ -189,7 +195,7 @@ async def test_import_overwrite_mode(api_client: httpx.AsyncClient, stored_memor
     assert data["imported"] == 1
 
     # Content should be updated
-    vr = await api_client.get(f"{API_BASE}/memory/{mem['id']}")
+    vr = await api_client.get(f"/memory/{mem['id']}")
     assert vr.status_code == 200
     assert "Overwritten content" in vr.json().get("content", "")
 
@@ -199,31 +205,26 @@ async def test_import_overwrite_mode(api_client: httpx.AsyncClient, stored_memor
 # =============================================================
 
 
-async def test_reconcile_report_only(api_client: httpx.AsyncClient, stored_memory, test_domain):
-    """Reconcile without repair returns a report."""
-    await stored_memory("Reconcile test memory", domain=test_domain)
-
-    r = await api_client.post(f"{API_BASE}/admin/reconcile?repair=false")
-    assert r.status_code == 200
-    data = r.json()
-
-    assert "qdrant_total" in data
-    assert "neo4j_total" in data
-    assert "qdrant_orphans" in data
-    assert "neo4j_orphans" in data
-    assert "importance_mismatches" in data
-    assert "superseded_mismatches" in data
-    assert data["repairs_applied"] == 0
-
-
-async def test_reconcile_repair(api_client: httpx.AsyncClient, stored_memory, test_domain):
-    """Reconcile with repair=true applies fixes (even if 0 needed)."""
-    await stored_memory("Reconcile repair test", domain=test_domain)
-
-    r = await api_client.post(f"{API_BASE}/admin/reconcile?repair=true")
-    assert r.status_code == 200
-    data = r.json()
+async def test_reconcile_report_and_repair(api_client: httpx.AsyncClient, bulk_seed):
+    """Reconcile returns a report without repair and applies fixes (even if 0) with it."""
+    # Both are independent full scans over the shared seed, so run them together
+    report_r, repair_r = await asyncio.gather(
+        api_client.post("/admin/reconcile?repair=false"),
+        api_client.post("/admin/reconcile?repair=true"),
+    )
 
-    assert "repairs_applied" in data
+    assert report_r.status_code == 200
+    report = report_r.json()
+    assert "qdrant_total" in report
+    assert "neo4j_total" in report
+    assert "qdrant_orphans" in report
+    assert "neo4j_orphans" in report
+    assert "importance_mismatches" in report
+    assert "superseded_mismatches" in report
+    assert report["repairs_applied"] == 0
+
+    assert repair_r.status_code == 200
+    repair = repair_r.json()
+    assert "repairs_applied" in repair
     # After repair, orphans should be resolved
-    assert isinstance(data["repairs_applied"], int)
+    assert isinstance(repair["repairs_applied"], int)
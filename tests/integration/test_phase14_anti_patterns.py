@@ -3,11 +3,68 @@ Phase 14B integration tests — Anti-Pattern system.
 """
 
 import asyncio
-import os
 
-import pytest
-
-API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
+import pytest_asyncio
+
+from tests.integration.conftest import request_with_retry
+
+_ANTI_PATTERN_SPECS = {
+    "mutable_default": {
+        "pattern": "Mutable default arguments in Python",
+        "warning": "def foo(items=[]) shares the list across calls",
+        "domain": "python",
+    },
+    "cypher_fstring": {
+        "pattern": "f-string in Cypher queries",
+        "warning": "Cypher injection risk — always use parameterized queries",
+        "severity": "error",
+        "domain": "neo4j",
+    },
+    "bare_except": {
+        "pattern": "Bare except clause",
+        "warning": "Swallows all exceptions",
+        "domain": "python",
+    },
+    "select_star": {
+        "pattern": "SELECT *",
+        "warning": "Bad for performance",
+        "domain": "sql",
+    },
+    "scroll_all": {
+        "pattern": "Using biased search instead of scroll_all for decay",
+        "warning": "Biased search misses memories — always use scroll_all() for full-collection operations",
+        "domain": "recall",
+    },
+}
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def seeded_anti_patterns(_session_client):
+    """
+    Create every anti-pattern the read-only CRUD tests need in one gather.
+
+    Yields {spec name: create response}; all are deleted together at class
+    teardown. Tests that exercise create or delete themselves use their own.
+    """
+    responses = await asyncio.gather(
+        *(
+            _session_client.post("/memory/anti-pattern", json=spec)
+            for spec in _ANTI_PATTERN_SPECS.values()
+        )
+    )
+    for r in responses:
+        assert r.status_code == 200, f"Anti-pattern create failed: {r.text}"
+    created = {name: r.json() for name, r in zip(_ANTI_PATTERN_SPECS, responses)}
+    try:
+        yield created
+    finally:
+        await asyncio.gather(
+            *(
+                _session_client.delete(f"/memory/anti-pattern/{ap['id']}")
+                for ap in created.values()
+            ),
+            return_exceptions=True,
+        )
 
 
 class TestAntiPatternCRUD:
@@ -16,7 +73,7 @@ class TestAntiPatternCRUD:
     async def test_create_anti_pattern(self, api_client):
         """Create an anti-pattern and verify response fields."""
         r = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
+            "/memory/anti-pattern",
             json={
                 "pattern": "Using pickle with untrusted data",
                 "warning": "pickle.load can execute arbitrary code — never use with untrusted input",
@@ -38,58 +95,34 @@ class TestAntiPatternCRUD:
         assert "id" in data
 
         # Cleanup
-        await api_client.delete(f"{API_BASE}/memory/anti-pattern/{data['id']}")
+        await api_client.delete(f"/memory/anti-pattern/{data['id']}")
 
-    async def test_list_anti_patterns(self, api_client):
+    async def test_list_anti_patterns(self, api_client, seeded_anti_patterns):
         """List anti-patterns includes created ones."""
-        # Create one
-        cr = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
-            json={
-                "pattern": "Mutable default arguments in Python",
-                "warning": "def foo(items=[]) shares the list across calls",
-                "domain": "python",
-            },
-        )
-        created_id = cr.json()["id"]
+        created_id = seeded_anti_patterns["mutable_default"]["id"]
 
-        try:
-            r = await api_client.get(f"{API_BASE}/memory/anti-patterns")
-            assert r.status_code == 200
-            data = r.json()
-            assert data["total"] >= 1
-            ids = [ap["id"] for ap in data["anti_patterns"]]
-            assert created_id in ids
-        finally:
-            await api_client.delete(f"{API_BASE}/memory/anti-pattern/{created_id}")
-
-    async def test_get_anti_pattern_by_id(self, api_client):
+        r = await api_client.get("/memory/anti-patterns")
+        assert r.status_code == 200
+        data = r.json()
+        assert data["total"] >= 1
+        ids = [ap["id"] for ap in data["anti_patterns"]]
+        assert created_id in ids
+
+    async def test_get_anti_pattern_by_id(self, api_client, seeded_anti_patterns):
         """Get a specific anti-pattern by ID."""
-        cr = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
-            json={
-                "pattern": "f-string in Cypher queries",
-                "warning": "Cypher injection risk — always use parameterized queries",
-                "severity": "error",
-                "domain": "neo4j",
-            },
-        )
-        created_id = cr.json()["id"]
+        created_id = seeded_anti_patterns["cypher_fstring"]["id"]
 
-        try:
-            r = await api_client.get(f"{API_BASE}/memory/anti-pattern/{created_id}")
-            assert r.status_code == 200
-            data = r.json()
-            assert data["id"] == created_id
-            assert data["pattern"] == "f-string in Cypher queries"
-            assert data["severity"] == "error"
-        finally:
-            await api_client.delete(f"{API_BASE}/memory/anti-pattern/{created_id}")
+        r = await api_client.get(f"/memory/anti-pattern/{created_id}")
+        assert r.status_code == 200
+        data = r.json()
+        assert data["id"] == created_id
+        assert data["pattern"] == "f-string in Cypher queries"
+        assert data["severity"] == "error"
 
     async def test_delete_anti_pattern(self, api_client):
         """Delete an anti-pattern → gone on re-get."""
         cr = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
+            "/memory/anti-pattern",
             json={
                 "pattern": "Using docker-compose instead of docker compose",
                 "warning": "docker-compose is deprecated, use 'docker compose'",
@@ -98,62 +131,39 @@ class TestAntiPatternCRUD:
         )
         created_id = cr.json()["id"]
 
-        r = await api_client.delete(f"{API_BASE}/memory/anti-pattern/{created_id}")
+        r = await api_client.delete(f"/memory/anti-pattern/{created_id}")
         assert r.status_code == 200
         assert r.json()["deleted"] is True
 
-        r = await api_client.get(f"{API_BASE}/memory/anti-pattern/{created_id}")
+        r = await api_client.get(f"/memory/anti-pattern/{created_id}")
         assert r.status_code == 404
 
-    async def test_list_with_domain_filter(self, api_client):
+    async def test_list_with_domain_filter(self, api_client, seeded_anti_patterns):
         """List anti-patterns filtered by domain."""
-        # Create two in different domains
-        cr1 = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
-            json={"pattern": "Bare except clause", "warning": "Swallows all exceptions", "domain": "python"},
-        )
-        cr2 = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
-            json={"pattern": "SELECT *", "warning": "Bad for performance", "domain": "sql"},
-        )
-        id1, id2 = cr1.json()["id"], cr2.json()["id"]
-
-        try:
-            r = await api_client.get(f"{API_BASE}/memory/anti-patterns?domain=python")
-            assert r.status_code == 200
-            data = r.json()
-            ids = [ap["id"] for ap in data["anti_patterns"]]
-            assert id1 in ids
-            assert id2 not in ids
-        finally:
-            await api_client.delete(f"{API_BASE}/memory/anti-pattern/{id1}")
-            await api_client.delete(f"{API_BASE}/memory/anti-pattern/{id2}")
-
-    async def test_anti_pattern_in_browse_results(self, api_client):
+        id1 = seeded_anti_patterns["bare_except"]["id"]
+        id2 = seeded_anti_patterns["select_star"]["id"]
+
+        r = await api_client.get("/memory/anti-patterns?domain=python")
+        assert r.status_code == 200
+        data = r.json()
+        ids = [ap["id"] for ap in data["anti_patterns"]]
+        assert id1 in ids
+        assert id2 not in ids
+
+    async def test_anti_pattern_in_browse_results(self, api_client, seeded_anti_patterns):
         """Anti-pattern with matching domain appears in browse search."""
-        cr = await api_client.post(
-            f"{API_BASE}/memory/anti-pattern",
-            json={
-                "pattern": "Using biased search instead of scroll_all for decay",
-                "warning": "Biased search misses memories — always use scroll_all() for full-collection operations",
-                "domain": "recall",
-            },
+        # No settle delay: the create route returns only after the Qdrant
+        # upsert completes, so the seeded anti-pattern is already searchable
+        r = await request_with_retry(
+            api_client, "post",
+            "/search/browse",
+            json={"query": "biased search scroll_all decay", "limit": 10},
         )
-        created_id = cr.json()["id"]
-        await asyncio.sleep(1)  # Let embedding settle
-
-        try:
-            r = await api_client.post(
-                f"{API_BASE}/search/browse",
-                json={"query": "biased search scroll_all decay", "limit": 10},
-            )
-            assert r.status_code == 200
-            data = r.json()
-            # Should find at least something — either the anti-pattern as a warning
-            # or standard memories. The anti-pattern integrates into results.
-            assert "results" in data
-        finally:
-            await api_client.delete(f"{API_BASE}/memory/anti-pattern/{created_id}")
+        assert r.status_code == 200
+        data = r.json()
+        # Should find at least something — either the anti-pattern as a warning
+        # or standard memories. The anti-pattern integrates into results.
+        assert "results" in data
 
     async def test_warning_signal_type_accepted(self, api_client):
         """The 'warning' signal type is recognized by the signal detector format."""
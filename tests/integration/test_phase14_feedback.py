@@ -2,14 +2,34 @@
 Phase 14C integration tests — Retrieval Feedback Loop.
 """
 
-import asyncio
 import os
 
 import pytest
+import pytest_asyncio
+
+from tests.integration.conftest import private_domain, seeded_memories
 
 API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def feedback_target(_session_client):
+    """
+    One indexed memory shared by the feedback tests that only need *a* target.
+
+    Those tests assert on the response or the audit trail, not on the
+    memory's absolute importance, so repeated feedback on it is harmless.
+    Tests that check importance movement store their own memory.
+    """
+    payload = {
+        "content": "Neo4j graph database models relationships between entities",
+        "domain": private_domain("feedback"),
+        "importance": 0.5,
+    }
+    async with seeded_memories(_session_client, [payload]) as (mem,):
+        yield mem
+
+
 class TestFeedbackEndpoint:
     """Test POST /memory/feedback."""
 
@@ -19,7 +39,6 @@ class TestFeedbackEndpoint:
             "FastAPI uses Pydantic models for request validation and serialization",
             importance=0.5,
         )
-        await asyncio.sleep(0.5)  # Let embedding settle
 
         # Submit feedback with highly related assistant text
         r = await api_client.post(
@@ -41,12 +60,13 @@ class TestFeedbackEndpoint:
         assert data["useful"] + data["not_useful"] == 1
         assert data["not_found"] == 0
 
-        # Verify importance changed
-        r = await api_client.get(f"{API_BASE}/memory/{mem['id']}")
-        assert r.status_code == 200
-        new_importance = r.json()["importance"]
-        # It either went up (useful) or down slightly (not useful) — confirm it's not 0.5 anymore
-        assert new_importance != 0.5 or True  # May round back; the endpoint executed correctly
+        # The response carries the post-feedback importance: up when useful,
+        # down slightly when not
+        new_importance = data["importance"][mem["id"]]
+        if data["useful"]:
+            assert new_importance > 0.5
+        else:
+            assert new_importance < 0.5
 
     async def test_feedback_not_useful_decreases_importance(self, api_client, stored_memory, cleanup):
         """Feedback with unrelated assistant text penalizes importance."""
@@ -54,7 +74,6 @@ class TestFeedbackEndpoint:
             "Recipe for chocolate cake: mix flour, sugar, cocoa powder, and eggs",
             importance=0.5,
         )
-        await asyncio.sleep(0.5)
 
         # Submit feedback with completely unrelated assistant text
         r = await api_client.post(
@@ -76,21 +95,11 @@ class TestFeedbackEndpoint:
         assert data["useful"] == 0
 
         # Verify importance decreased
-        r = await api_client.get(f"{API_BASE}/memory/{mem['id']}")
-        assert r.status_code == 200
-        assert r.json()["importance"] < 0.5
+        assert data["importance"][mem["id"]] < 0.5
 
-    async def test_feedback_updates_stability(self, api_client, stored_memory, cleanup):
+    async def test_feedback_updates_stability(self, api_client, feedback_target):
         """Feedback adjusts stability alongside importance."""
-        mem = await stored_memory(
-            "Docker compose volumes mount host paths into containers",
-            importance=0.5,
-        )
-        await asyncio.sleep(0.5)
-
-        # Get original stability (defaults vary, just check it changes)
-        r = await api_client.get(f"{API_BASE}/memory/{mem['id']}")
-        original = r.json()
+        mem = feedback_target
 
         r = await api_client.post(
             f"{API_BASE}/memory/feedback",
@@ -106,12 +115,13 @@ class TestFeedbackEndpoint:
         )
         assert r.status_code == 200
 
-    async def test_batch_feedback_processes_multiple(self, api_client, stored_memory, cleanup):
+    async def test_batch_feedback_processes_multiple(self, api_client, stored_memories_batch):
         """Feedback with multiple memory IDs processes each one."""
-        mem1 = await stored_memory("Python asyncio event loop runs coroutines concurrently")
-        mem2 = await stored_memory("Redis pub/sub for real-time message broadcasting")
-        mem3 = await stored_memory("Qdrant vector database stores embeddings for semantic search")
-        await asyncio.sleep(0.5)
+        mem1, mem2, mem3 = await stored_memories_batch([
+            {"content": "Python asyncio event loop runs coroutines concurrently"},
+            {"content": "Redis pub/sub for real-time message broadcasting"},
+            {"content": "Qdrant vector database stores embeddings for semantic search"},
+        ])
 
         r = await api_client.post(
             f"{API_BASE}/memory/feedback",
@@ -149,10 +159,9 @@ class TestFeedbackEndpoint:
         assert data["useful"] == 0
         assert data["not_useful"] == 0
 
-    async def test_feedback_audit_log_created(self, api_client, stored_memory, cleanup):
+    async def test_feedback_audit_log_created(self, api_client, feedback_target):
         """Feedback creates audit log entries."""
-        mem = await stored_memory("Neo4j graph database models relationships between entities")
-        await asyncio.sleep(0.5)
+        mem = feedback_target
 
         await api_client.post(
             f"{API_BASE}/memory/feedback",
@@ -166,13 +175,17 @@ class TestFeedbackEndpoint:
             },
         )
 
-        # Check audit log for feedback entry
-        r = await api_client.get(f"{API_BASE}/admin/audit?limit=5")
+        # Check audit log for feedback entry — scoped to this memory so
+        # concurrent tests (e.g. other xdist workers) can't crowd it out
+        r = await api_client.get(
+            f"{API_BASE}/admin/audit",
+            params={"memory_id": mem["id"], "action": "feedback", "limit": 1},
+        )
         assert r.status_code == 200
-        data = r.json()
-        feedback_entries = [e for e in data["entries"] if e["action"] == "feedback"]
-        assert len(feedback_entries) >= 1
-        entry = feedback_entries[0]
+        entries = r.json()["entries"]
+        assert len(entries) >= 1
+        entry = entries[0]
+        assert entry["action"] == "feedback"
         assert entry["memory_id"] == mem["id"]
         assert "useful" in entry["details"]
         assert "similarity" in entry["details"]
@@ -183,10 +196,9 @@ class TestFeedbackEndpoint:
             "FastAPI dependency injection provides request-scoped resources",
             importance=0.98,
         )
-        await asyncio.sleep(0.5)
 
         # Submit feedback that should be useful
-        await api_client.post(
+        r = await api_client.post(
             f"{API_BASE}/memory/feedback",
             json={
                 "injected_ids": [mem["id"]],
@@ -197,7 +209,5 @@ class TestFeedbackEndpoint:
                 ),
             },
         )
-
-        r = await api_client.get(f"{API_BASE}/memory/{mem['id']}")
         assert r.status_code == 200
-        assert r.json()["importance"] <= 1.0
+        assert r.json()["importance"][mem["id"]] <= 1.0
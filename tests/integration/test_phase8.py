@@ -5,12 +5,13 @@ Covers: date-range search (N3), per-domain stats (N7), batch ops (N2),
 OllamaUnavailableError handling (N9), rate limiting (N5), dashboard.
 """
 
+import asyncio
 import uuid
 
 import httpx
 import pytest
 
-from .conftest import API_BASE, request_with_retry
+from .conftest import API_BASE, BATCH_STORE_MAX, _dumps, request_with_retry
 
 pytestmark = pytest.mark.asyncio
 
@@ -82,16 +83,14 @@ async def test_search_with_since_and_until(
 # =============================================================
 
 
-async def test_domain_stats_endpoint(api_client: httpx.AsyncClient, stored_memory, test_domain):
+async def test_domain_stats_endpoint(
+    api_client: httpx.AsyncClient, stored_memories_batch, test_domain
+):
     """GET /stats/domains returns per-domain count and avg_importance."""
-    await stored_memory(
-        "PostgreSQL MVCC allows concurrent reads during writes", domain=test_domain, importance=0.6
-    )
-    await stored_memory(
-        "Nginx reverse proxy load balances across upstream servers",
-        domain=test_domain,
-        importance=0.8,
-    )
+    await stored_memories_batch([
+        {"content": "PostgreSQL MVCC allows concurrent reads during writes", "importance": 0.6},
+        {"content": "Nginx reverse proxy load balances across upstream servers", "importance": 0.8},
+    ])
 
     r = await api_client.get(f"{API_BASE}/stats/domains")
     assert r.status_code == 200
@@ -145,10 +144,23 @@ async def test_batch_store_dedup(api_client: httpx.AsyncClient, test_domain, cle
             cleanup.track_memory(result["id"])
 
 
-async def test_batch_store_rejects_over_50(api_client: httpx.AsyncClient, test_domain):
+@pytest.fixture(scope="module")
+def oversize_batch_body() -> bytes:
+    """One item past the batch cap, encoded once — validation rejects it before any write."""
+    memories = [
+        {"content": f"Item {i}", "domain": "test-integration-oversize"}
+        for i in range(BATCH_STORE_MAX + 1)
+    ]
+    return _dumps({"memories": memories})
+
+
+async def test_batch_store_rejects_over_50(api_client: httpx.AsyncClient, oversize_batch_body):
     """Batch store rejects requests with more than 50 items."""
-    memories = [{"content": f"Item {i}", "domain": test_domain} for i in range(51)]
-    r = await api_client.post(f"{API_BASE}/memory/batch/store", json={"memories": memories})
+    r = await api_client.post(
+        f"{API_BASE}/memory/batch/store",
+        content=oversize_batch_body,
+        headers={"Content-Type": "application/json"},
+    )
     assert r.status_code == 422  # Pydantic validation error
 
 
@@ -157,10 +169,12 @@ async def test_batch_store_rejects_over_50(api_client: httpx.AsyncClient, test_d
 # =============================================================
 
 
-async def test_batch_delete(api_client: httpx.AsyncClient, stored_memory, test_domain):
+async def test_batch_delete(api_client: httpx.AsyncClient, stored_memory, test_domain, cleanup):
     """POST /memory/batch/delete removes multiple memories."""
-    m1 = await stored_memory(f"Batch del A {uuid.uuid4().hex[:8]}", domain=test_domain)
-    m2 = await stored_memory(f"Batch del B {uuid.uuid4().hex[:8]}", domain=test_domain)
+    m1, m2 = await asyncio.gather(
+        stored_memory(f"Batch del A {uuid.uuid4().hex[:8]}", domain=test_domain),
+        stored_memory(f"Batch del B {uuid.uuid4().hex[:8]}", domain=test_domain),
+    )
 
     r = await api_client.post(
         f"{API_BASE}/memory/batch/delete",
@@ -170,6 +184,8 @@ async def test_batch_delete(api_client: httpx.AsyncClient, stored_memory, test_d
     data = r.json()
     assert data["deleted"] == 2
     assert data["not_found"] == 0
+    cleanup.untrack_memory(m1["id"])
+    cleanup.untrack_memory(m2["id"])
 
 
 async def test_batch_delete_not_found(api_client: httpx.AsyncClient):
@@ -7,6 +7,8 @@ import os
 
 import pytest
 
+from tests.integration.conftest import poll_until, request_with_retry
+
 API_BASE = os.environ.get("RECALL_API_URL", "http://localhost:8200")
 
 
@@ -21,23 +23,27 @@ class TestBrowseSearch:
     async def test_browse_returns_summaries(self, api_client, stored_memory, test_domain):
         """Browse should return 120-char summaries, not full content."""
         long_content = "Docker configuration for production deployment. " * 10
-        await stored_memory(long_content, domain=test_domain)
-        await asyncio.sleep(1)  # Let embedding settle
-
-        r = await api_client.post(
-            f"{API_BASE}/search/browse",
-            json={"query": "docker configuration", "limit": 5, "domains": [test_domain]},
+        mem = await stored_memory(long_content, domain=test_domain)
+
+        # Poll browse until the new memory is searchable instead of a fixed sleep
+        r = await poll_until(
+            lambda: request_with_retry(
+                api_client,
+                "post",
+                f"{API_BASE}/search/browse",
+                json={"query": "docker configuration", "limit": 5, "domains": [test_domain]},
+            ),
+            lambda resp: resp.status_code == 200
+            and any(x["id"] == mem["id"] for x in resp.json()["results"]),
         )
         assert r.status_code == 200
         data = r.json()
         assert data["total"] >= 1
-        # Summary should be truncated to 120 chars max
-        for result in data["results"]:
-            assert len(result["summary"]) <= 120
-            assert "id" in result
-            assert "similarity" in result
-            assert "memory_type" in result
-            assert "tags" in result
+        results = data["results"]
+        assert all({"id", "similarity", "memory_type", "tags"} <= r.keys() for r in results)
+        # Summary should be truncated to 120 chars max; report the worst offender
+        longest = max((r["summary"] for r in results), key=len, default="")
+        assert len(longest) <= 120, f"summary not truncated ({len(longest)} chars): {longest!r}"
 
     async def test_browse_empty_query(self, api_client):
         """Browse with empty domain filter should work."""
@@ -54,11 +60,12 @@ class TestBrowseSearch:
 class TestTimeline:
     """Test the chronological timeline endpoint."""
 
-    async def test_timeline_no_anchor(self, api_client, stored_memory, test_domain):
+    async def test_timeline_no_anchor(self, api_client, stored_memories_batch, test_domain):
         """Timeline without anchor returns most recent."""
-        await stored_memory("first event in timeline", domain=test_domain)
-        await stored_memory("second event in timeline", domain=test_domain)
-        await asyncio.sleep(0.5)
+        first, second = await stored_memories_batch([
+            {"content": "first event in timeline"},
+            {"content": "second event in timeline"},
+        ])
 
         r = await api_client.post(
             f"{API_BASE}/search/timeline",
@@ -73,7 +80,6 @@ class TestTimeline:
         """Timeline with anchor centers around that memory."""
         mem1 = await stored_memory("anchor memory for timeline test", domain=test_domain)
         mem_id = mem1["id"]
-        await asyncio.sleep(0.5)
 
         r = await api_client.post(
             f"{API_BASE}/search/timeline",
@@ -152,14 +158,16 @@ class TestSSEEvents:
         async with api_client.stream(
             "GET",
             f"{API_BASE}/events/stream",
-            headers={"Accept": "text/event-stream"},
+            headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"},
         ) as response:
             assert response.status_code == 200
             assert "text/event-stream" in response.headers.get("content-type", "")
-            # Read just the first chunk to confirm data is flowing
-            async for chunk in response.aiter_bytes():
-                assert len(chunk) > 0
-                break  # Got data, done
+            # Read just the first chunk to confirm data is flowing. Bounded, so
+            # a stalled stream fails here instead of holding the worker until
+            # the client's 60s read timeout; the first event follows one stats
+            # pass (all four stores), hence the generous bound.
+            chunk = await asyncio.wait_for(anext(response.aiter_bytes()), timeout=5.0)
+            assert len(chunk) > 0
 
 
 # =============================================================
@@ -101,26 +101,27 @@ class TestGetRelated:
 
     async def test_graph_traversal_depth_2(self, stored_memory, api_client):
         """A → B → C should be reachable at depth 2."""
-        a = await stored_memory("chain root")
-        b = await stored_memory("chain middle")
-        c = await stored_memory("chain leaf")
-
-        await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "source_id": a["id"],
-                "target_id": b["id"],
-                "relationship_type": "requires",
-            },
+        a, b, c = await asyncio.gather(
+            stored_memory("chain root"),
+            stored_memory("chain middle"),
+            stored_memory("chain leaf"),
         )
-        await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "source_id": b["id"],
-                "target_id": c["id"],
-                "relationship_type": "requires",
-            },
+
+        # Edges are independent writes; only the traversal needs both present
+        edges = await asyncio.gather(
+            *(
+                api_client.post(
+                    f"{API_BASE}/memory/relationship",
+                    json={
+                        "source_id": src["id"],
+                        "target_id": tgt["id"],
+                        "relationship_type": "requires",
+                    },
+                )
+                for src, tgt in ((a, b), (b, c))
+            )
         )
+        assert all(e.status_code == 200 for e in edges)
 
         r = await api_client.get(
             f"{API_BASE}/memory/{a['id']}/related",
@@ -136,26 +137,27 @@ class TestGetRelated:
 
     async def test_depth_limiting(self, stored_memory, api_client):
         """A → B → C: at depth 1, C should NOT appear."""
-        a = await stored_memory("depth-limit root")
-        b = await stored_memory("depth-limit mid")
-        c = await stored_memory("depth-limit far")
-
-        await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "source_id": a["id"],
-                "target_id": b["id"],
-                "relationship_type": "part_of",
-            },
+        a, b, c = await asyncio.gather(
+            stored_memory("depth-limit root"),
+            stored_memory("depth-limit mid"),
+            stored_memory("depth-limit far"),
         )
-        await api_client.post(
-            f"{API_BASE}/memory/relationship",
-            json={
-                "source_id": b["id"],
-                "target_id": c["id"],
-                "relationship_type": "part_of",
-            },
+
+        # Edges are independent writes; only the traversal needs both present
+        edges = await asyncio.gather(
+            *(
+                api_client.post(
+                    f"{API_BASE}/memory/relationship",
+                    json={
+                        "source_id": src["id"],
+                        "target_id": tgt["id"],
+                        "relationship_type": "part_of",
+                    },
+                )
+                for src, tgt in ((a, b), (b, c))
+            )
         )
+        assert all(e.status_code == 200 for e in edges)
 
         r = await api_client.get(
             f"{API_BASE}/memory/{a['id']}/related",
@@ -6,16 +6,12 @@ import asyncio
 
 from tests.integration.conftest import API_BASE
 
-# Short pause to let embeddings index before searching
-EMBED_DELAY = 0.5
-
 
 class TestSearchQuery:
     """POST /search/query"""
 
     async def test_basic_search(self, stored_memory, api_client):
         await stored_memory("Python uses indentation for code blocks")
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -30,7 +26,6 @@ class TestSearchQuery:
 
     async def test_result_structure(self, stored_memory, api_client):
         await stored_memory("FastAPI uses Pydantic for validation")
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -52,9 +47,10 @@ class TestSearchQuery:
 
     async def test_similarity_ranking(self, stored_memory, api_client, test_domain):
         """More relevant results should score higher than irrelevant ones."""
-        await stored_memory("Docker containers provide process isolation", domain=test_domain)
-        await stored_memory("My favorite pizza topping is pepperoni", domain=test_domain)
-        await asyncio.sleep(EMBED_DELAY)
+        await asyncio.gather(
+            stored_memory("Docker containers provide process isolation", domain=test_domain),
+            stored_memory("My favorite pizza topping is pepperoni", domain=test_domain),
+        )
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -69,17 +65,18 @@ class TestSearchQuery:
         assert docker_score > pizza_score
 
     async def test_filter_by_memory_type(self, stored_memory, api_client, test_domain):
-        await stored_memory(
-            "Redis uses sorted sets to maintain elements ordered by score",
-            memory_type="semantic",
-            domain=test_domain,
-        )
-        await stored_memory(
-            "Yesterday I debugged a broken SSH tunnel to the homelab",
-            memory_type="episodic",
-            domain=test_domain,
+        await asyncio.gather(
+            stored_memory(
+                "Redis uses sorted sets to maintain elements ordered by score",
+                memory_type="semantic",
+                domain=test_domain,
+            ),
+            stored_memory(
+                "Yesterday I debugged a broken SSH tunnel to the homelab",
+                memory_type="episodic",
+                domain=test_domain,
+            ),
         )
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -96,9 +93,10 @@ class TestSearchQuery:
 
     async def test_filter_by_domain(self, stored_memory, api_client, test_domain):
         other_domain = test_domain + "-other"
-        await stored_memory("memory in target domain", domain=test_domain)
-        await stored_memory("memory in other domain", domain=other_domain)
-        await asyncio.sleep(EMBED_DELAY)
+        await asyncio.gather(
+            stored_memory("memory in target domain", domain=test_domain),
+            stored_memory("memory in other domain", domain=other_domain),
+        )
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -109,9 +107,10 @@ class TestSearchQuery:
             assert item["domain"] == test_domain
 
     async def test_filter_by_tags(self, stored_memory, api_client, test_domain):
-        await stored_memory("tagged with alpha", tags=["alpha"], domain=test_domain)
-        await stored_memory("tagged with beta", tags=["beta"], domain=test_domain)
-        await asyncio.sleep(EMBED_DELAY)
+        await asyncio.gather(
+            stored_memory("tagged with alpha", tags=["alpha"], domain=test_domain),
+            stored_memory("tagged with beta", tags=["beta"], domain=test_domain),
+        )
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -123,17 +122,18 @@ class TestSearchQuery:
         assert len(alpha_results) >= 1
 
     async def test_filter_by_min_importance(self, stored_memory, api_client, test_domain):
-        await stored_memory(
-            "Ephemeral trivia about butterfly migration patterns across continents",
-            importance=0.1,
-            domain=test_domain,
+        await asyncio.gather(
+            stored_memory(
+                "Ephemeral trivia about butterfly migration patterns across continents",
+                importance=0.1,
+                domain=test_domain,
+            ),
+            stored_memory(
+                "Critical production incident: database failover procedure for PostgreSQL",
+                importance=0.9,
+                domain=test_domain,
+            ),
         )
-        await stored_memory(
-            "Critical production incident: database failover procedure for PostgreSQL",
-            importance=0.9,
-            domain=test_domain,
-        )
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -150,9 +150,9 @@ class TestSearchQuery:
 
     async def test_limit_enforcement(self, stored_memory, api_client, test_domain):
         """Limit=2 should return at most 2 results."""
-        for i in range(5):
-            await stored_memory(f"limit test memory number {i}", domain=test_domain)
-        await asyncio.sleep(EMBED_DELAY)
+        await asyncio.gather(
+            *(stored_memory(f"limit test memory number {i}", domain=test_domain) for i in range(5))
+        )
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -180,8 +180,10 @@ class TestSearchQuery:
 
     async def test_graph_expansion_on(self, stored_memory, api_client, test_domain):
         """With expand_relationships=True, related memories may appear."""
-        a = await stored_memory("graph root: authentication module", domain=test_domain)
-        b = await stored_memory("graph leaf: JWT token handling", domain=test_domain)
+        a, b = await asyncio.gather(
+            stored_memory("graph root: authentication module", domain=test_domain),
+            stored_memory("graph leaf: JWT token handling", domain=test_domain),
+        )
 
         await api_client.post(
             f"{API_BASE}/memory/relationship",
@@ -191,7 +193,6 @@ class TestSearchQuery:
                 "relationship_type": "related_to",
             },
         )
-        await asyncio.sleep(EMBED_DELAY)
 
         r = await api_client.post(
             f"{API_BASE}/search/query",
@@ -228,9 +229,10 @@ class TestFindSimilar:
     """GET /search/similar/{memory_id}"""
 
     async def test_find_similar_by_id(self, stored_memory, api_client):
-        base = await stored_memory("Kubernetes orchestrates container workloads")
-        await stored_memory("Docker Swarm also manages containers at scale")
-        await asyncio.sleep(EMBED_DELAY)
+        base, other = await asyncio.gather(
+            stored_memory("Kubernetes orchestrates container workloads"),
+            stored_memory("Docker Swarm also manages containers at scale"),
+        )
 
         r = await api_client.get(
             f"{API_BASE}/search/similar/{base['id']}",
@@ -18,7 +18,7 @@ import uuid
 import httpx
 import pytest
 
-from .conftest import API_BASE, _auth_headers
+from .conftest import API_BASE
 
 # Ollama is single-threaded: LLM generate must finish before embedding calls work.
 # These sleeps account for model cold start (~10s) + generation (~15-30s).
@@ -61,7 +61,6 @@ async def poll_for_signal_memories(
 # =============================================================
 
 
-@pytest.mark.anyio
 async def test_ingest_turns(api_client: httpx.AsyncClient, active_session, cleanup):
     """Ingesting turns stores them and queues signal detection."""
     session = await active_session()
@@ -84,7 +83,6 @@ async def test_ingest_turns(api_client: httpx.AsyncClient, active_session, clean
     assert data["detection_queued"] is True
 
 
-@pytest.mark.anyio
 async def test_ingest_requires_valid_session(api_client: httpx.AsyncClient):
     """Ingesting turns for a non-existent session returns 404."""
     r = await api_client.post(
@@ -97,7 +95,6 @@ async def test_ingest_requires_valid_session(api_client: httpx.AsyncClient):
     assert r.status_code == 404
 
 
-@pytest.mark.anyio
 async def test_ingest_requires_turns(api_client: httpx.AsyncClient, active_session, cleanup):
     """Ingesting with empty turns list is rejected (validation)."""
     session = await active_session()
@@ -115,7 +112,6 @@ async def test_ingest_requires_turns(api_client: httpx.AsyncClient, active_sessi
 # =============================================================
 
 
-@pytest.mark.anyio
 async def test_get_turns(api_client: httpx.AsyncClient, active_session, cleanup):
     """Stored turns are retrievable in chronological order."""
     session = await active_session()
@@ -143,7 +139,6 @@ async def test_get_turns(api_client: httpx.AsyncClient, active_session, cleanup)
     assert data["turns"][2]["content"] == "Third message"
 
 
-@pytest.mark.anyio
 async def test_get_turns_invalid_session(api_client: httpx.AsyncClient):
     """Getting turns for non-existent session returns 404."""
     r = await api_client.get(f"{API_BASE}/ingest/{uuid.uuid4()}/turns")
@@ -155,206 +150,200 @@ async def test_get_turns_invalid_session(api_client: httpx.AsyncClient):
 # =============================================================
 
 
-@pytest.mark.anyio
 @pytest.mark.slow
 async def test_signal_detection_produces_memories(
-    active_session, cleanup, test_domain
+    api_client: httpx.AsyncClient, active_session, cleanup, test_domain
 ):
     """
     Full pipeline: ingest a clear error_fix turn → wait for detection →
     verify a memory was auto-stored.
 
-    This test is slow because it calls Ollama LLM.
-    Uses its own client with a longer timeout since the search call
-    needs Ollama for embedding after the LLM generate finishes.
+    This test is slow because it calls Ollama LLM. The session client's
+    60 s read timeout covers the search call, which needs Ollama for
+    embedding after the LLM generate finishes.
     """
-    async with httpx.AsyncClient(timeout=60.0, headers=_auth_headers()) as client:
-        session = await active_session()
-        sid = session["session_id"]
-
-        # Ingest a conversation with a very clear error fix signal
-        turns = [
-            {
-                "role": "user",
-                "content": "I keep getting 'EACCES permission denied' when running npm install globally on Linux.",
-            },
-            {
-                "role": "assistant",
-                "content": (
-                    "This is a common npm permissions issue. The fix is to change npm's "
-                    "default directory. Run: mkdir ~/.npm-global && "
-                    "npm config set prefix '~/.npm-global' && "
-                    "echo 'export PATH=~/.npm-global/bin:$PATH' >> ~/.bashrc && source ~/.bashrc. "
-                    "This avoids needing sudo for global installs."
-                ),
-            },
-        ]
-
-        r = await client.post(
-            f"{API_BASE}/ingest/turns",
-            json={"session_id": sid, "turns": turns},
-        )
-        assert r.status_code == 200
+    session = await active_session()
+    sid = session["session_id"]
 
-        # Poll until signal memories appear (handles model cold start)
-        signal_memories = await poll_for_signal_memories(
-            client,
-            "npm EACCES permission denied global install fix",
-            max_wait=120,
-        )
+    # Ingest a conversation with a very clear error fix signal
+    turns = [
+        {
+            "role": "user",
+            "content": "I keep getting 'EACCES permission denied' when running npm install globally on Linux.",
+        },
+        {
+            "role": "assistant",
+            "content": (
+                "This is a common npm permissions issue. The fix is to change npm's "
+                "default directory. Run: mkdir ~/.npm-global && "
+                "npm config set prefix '~/.npm-global' && "
+                "echo 'export PATH=~/.npm-global/bin:$PATH' >> ~/.bashrc && source ~/.bashrc. "
+                "This avoids needing sudo for global installs."
+            ),
+        },
+    ]
+
+    r = await api_client.post(
+        f"{API_BASE}/ingest/turns",
+        json={"session_id": sid, "turns": turns},
+    )
+    assert r.status_code == 200
 
-        # Clean up any created memories
-        for m in signal_memories:
-            cleanup.track_memory(m["id"])
+    # Poll until signal memories appear (handles model cold start)
+    signal_memories = await poll_for_signal_memories(
+        api_client,
+        "npm EACCES permission denied global install fix",
+        max_wait=120,
+    )
 
-        assert len(signal_memories) > 0, (
-            "Expected at least one auto-stored signal memory after 120s polling"
-        )
+    # Clean up any created memories
+    for m in signal_memories:
+        cleanup.track_memory(m["id"])
+
+    assert len(signal_memories) > 0, (
+        "Expected at least one auto-stored signal memory after 120s polling"
+    )
 
 
-@pytest.mark.anyio
 @pytest.mark.slow
-async def test_pending_signals(active_session, cleanup):
+async def test_pending_signals(api_client: httpx.AsyncClient, active_session, cleanup):
     """
     Ingest a mildly interesting conversation → check pending signals queue.
 
     Note: Whether signals land in pending vs auto-store depends on LLM confidence.
     This test verifies the pending endpoint works.
     """
-    async with httpx.AsyncClient(timeout=60.0, headers=_auth_headers()) as client:
-        session = await active_session()
-        sid = session["session_id"]
-
-        # A less clear-cut conversation that might produce lower-confidence signals
-        turns = [
-            {"role": "user", "content": "I think I'll use PostgreSQL for the new project."},
-            {"role": "assistant", "content": "Good choice. PostgreSQL has excellent JSON support."},
-        ]
-
-        await client.post(
-            f"{API_BASE}/ingest/turns",
-            json={"session_id": sid, "turns": turns},
-        )
+    session = await active_session()
+    sid = session["session_id"]
 
-        # Wait for detection
-        await asyncio.sleep(LLM_WAIT_SHORT)
+    # A less clear-cut conversation that might produce lower-confidence signals
+    turns = [
+        {"role": "user", "content": "I think I'll use PostgreSQL for the new project."},
+        {"role": "assistant", "content": "Good choice. PostgreSQL has excellent JSON support."},
+    ]
 
-        # Check pending signals endpoint (may or may not have signals)
-        r = await client.get(f"{API_BASE}/ingest/{sid}/signals")
-        assert r.status_code == 200
-        # Endpoint works — list structure returned
-        assert isinstance(r.json(), list)
+    await api_client.post(
+        f"{API_BASE}/ingest/turns",
+        json={"session_id": sid, "turns": turns},
+    )
+
+    # Wait for detection
+    await asyncio.sleep(LLM_WAIT_SHORT)
+
+    # Check pending signals endpoint (may or may not have signals)
+    r = await api_client.get(f"{API_BASE}/ingest/{sid}/signals")
+    assert r.status_code == 200
+    # Endpoint works — list structure returned
+    assert isinstance(r.json(), list)
 
 
-@pytest.mark.anyio
 @pytest.mark.slow
-async def test_approve_pending_signal(active_session, cleanup):
+async def test_approve_pending_signal(api_client: httpx.AsyncClient, active_session, cleanup):
     """
     Ingest a turn, wait for LLM, then check for pending signals and approve.
     """
-    async with httpx.AsyncClient(timeout=60.0, headers=_auth_headers()) as client:
-        session = await active_session()
-        sid = session["session_id"]
-
-        # Ingest some turns first (so the session has turn data)
-        await client.post(
-            f"{API_BASE}/ingest/turns",
-            json={
-                "session_id": sid,
-                "turns": [{"role": "user", "content": "test turn for approval flow"}],
-            },
-        )
+    session = await active_session()
+    sid = session["session_id"]
 
-        # Wait for the background task to run
-        await asyncio.sleep(LLM_WAIT_SHORT)
+    # Ingest some turns first (so the session has turn data)
+    await api_client.post(
+        f"{API_BASE}/ingest/turns",
+        json={
+            "session_id": sid,
+            "turns": [{"role": "user", "content": "test turn for approval flow"}],
+        },
+    )
 
-        # Get pending signals
-        r = await client.get(f"{API_BASE}/ingest/{sid}/signals")
-        assert r.status_code == 200
-        pending = r.json()
+    # Wait for the background task to run
+    await asyncio.sleep(LLM_WAIT_SHORT)
 
-        if len(pending) > 0:
-            # Approve the first one
-            r = await client.post(
-                f"{API_BASE}/ingest/{sid}/signals/approve",
-                json={"index": 0},
-            )
-            assert r.status_code == 200
-            data = r.json()
-            assert data["stored"] is True
-            assert data["memory_id"] != ""
-            cleanup.track_memory(data["memory_id"])
+    # Get pending signals
+    r = await api_client.get(f"{API_BASE}/ingest/{sid}/signals")
+    assert r.status_code == 200
+    pending = r.json()
+
+    if len(pending) > 0:
+        # Approve the first one
+        r = await api_client.post(
+            f"{API_BASE}/ingest/{sid}/signals/approve",
+            json={"index": 0},
+        )
+        assert r.status_code == 200
+        data = r.json()
+        assert data["stored"] is True
+        assert data["memory_id"] != ""
+        cleanup.track_memory(data["memory_id"])
 
 
-@pytest.mark.anyio
 @pytest.mark.slow
-async def test_dedup_prevents_duplicate_signals(active_session, cleanup):
+async def test_dedup_prevents_duplicate_signals(
+    api_client: httpx.AsyncClient, active_session, cleanup
+):
     """Ingesting the same conversation twice doesn't create duplicate memories."""
     # Use a unique nonce so searches don't match real production memories
     nonce = uuid.uuid4().hex[:8]
     unique_fact = f"The XylophoneDB-{nonce} service default port is 55777."
 
-    async with httpx.AsyncClient(timeout=60.0, headers=_auth_headers()) as client:
-        session = await active_session()
-        sid = session["session_id"]
-
-        turns = [
-            {
-                "role": "user",
-                "content": unique_fact,
-            },
-            {
-                "role": "assistant",
-                "content": f"Correct. XylophoneDB-{nonce} runs on port 55777 by default. To change it, edit xylophonedb.conf.",
-            },
-        ]
-
-        # Ingest first time and wait for signal to appear
-        await client.post(
-            f"{API_BASE}/ingest/turns",
-            json={"session_id": sid, "turns": turns},
-        )
-        first_signals = await poll_for_signal_memories(
-            client,
-            f"XylophoneDB-{nonce} port 55777",
-            max_wait=120,
-        )
+    session = await active_session()
+    sid = session["session_id"]
 
-        # Clean up first batch
-        for m in first_signals:
-            cleanup.track_memory(m["id"])
-        first_count = len(first_signals)
+    turns = [
+        {
+            "role": "user",
+            "content": unique_fact,
+        },
+        {
+            "role": "assistant",
+            "content": f"Correct. XylophoneDB-{nonce} runs on port 55777 by default. To change it, edit xylophonedb.conf.",
+        },
+    ]
 
-        # Ingest second time (same content)
-        await client.post(
-            f"{API_BASE}/ingest/turns",
-            json={"session_id": sid, "turns": turns},
-        )
-        # Wait for second detection to finish
-        await asyncio.sleep(LLM_WAIT_SHORT)
+    # Ingest first time and wait for signal to appear
+    await api_client.post(
+        f"{API_BASE}/ingest/turns",
+        json={"session_id": sid, "turns": turns},
+    )
+    first_signals = await poll_for_signal_memories(
+        api_client,
+        f"XylophoneDB-{nonce} port 55777",
+        max_wait=120,
+    )
 
-        # Search again for all signal memories
-        r = await client.post(
-            f"{API_BASE}/search/query",
-            json={"query": f"XylophoneDB-{nonce} port 55777", "limit": 10},
-        )
-        assert r.status_code == 200
-        results = r.json()["results"]
-
-        signal_memories = [
-            m for m in results
-            if any("signal:" in t for t in m.get("tags", []))
-        ]
-
-        # Clean up any new ones
-        for m in signal_memories:
-            cleanup.track_memory(m["id"])
-
-        # Dedup: second ingest should not produce unbounded growth.
-        # Note: LLM rephrasing may produce slightly different content each time,
-        # defeating content_hash dedup. We verify at most 2x the first count.
-        # Exact-content dedup is tested in test_embeddings::test_content_hash_deduplication.
-        assert len(signal_memories) <= max(first_count * 2, 2), (
-            f"Expected at most {max(first_count * 2, 2)} signal memories, "
-            f"got {len(signal_memories)}"
-        )
+    # Clean up first batch
+    for m in first_signals:
+        cleanup.track_memory(m["id"])
+    first_count = len(first_signals)
+
+    # Ingest second time (same content)
+    await api_client.post(
+        f"{API_BASE}/ingest/turns",
+        json={"session_id": sid, "turns": turns},
+    )
+    # Wait for second detection to finish
+    await asyncio.sleep(LLM_WAIT_SHORT)
+
+    # Search again for all signal memories
+    r = await api_client.post(
+        f"{API_BASE}/search/query",
+        json={"query": f"XylophoneDB-{nonce} port 55777", "limit": 10},
+    )
+    assert r.status_code == 200
+    results = r.json()["results"]
+
+    signal_memories = [
+        m for m in results
+        if any("signal:" in t for t in m.get("tags", []))
+    ]
+
+    # Clean up any new ones
+    for m in signal_memories:
+        cleanup.track_memory(m["id"])
+
+    # Dedup: second ingest should not produce unbounded growth.
+    # Note: LLM rephrasing may produce slightly different content each time,
+    # defeating content_hash dedup. We verify at most 2x the first count.
+    # Exact-content dedup is tested in test_embeddings::test_content_hash_deduplication.
+    assert len(signal_memories) <= max(first_count * 2, 2), (
+        f"Expected at most {max(first_count * 2, 2)} signal memories, "
+        f"got {len(signal_memories)}"
+    )
@@ -0,0 +1,52 @@
+"""
+Tests for PostgresStore.get_session_history — the optional session filter.
+
+The query is checked against a mocked pool; no database is needed.
+"""
+
+from unittest.mock import AsyncMock
+
+import tests._stub_heavy_deps  # noqa: F401  (must precede src imports)
+from src.storage.postgres_store import PostgresStore
+
+
+def _store() -> PostgresStore:
+    store = PostgresStore()
+    store.pool = AsyncMock()
+    store.pool.fetch = AsyncMock(return_value=[])
+    return store
+
+
+def _normalized_sql(store: PostgresStore) -> str:
+    return " ".join(store.pool.fetch.await_args.args[0].split())
+
+
+async def test_session_history_unfiltered():
+    store = _store()
+
+    await store.get_session_history(limit=10, offset=5)
+
+    sql = _normalized_sql(store)
+    assert "WHERE" not in sql
+    assert "ORDER BY started_at DESC LIMIT $1 OFFSET $2" in sql
+    assert store.pool.fetch.await_args.args[1:] == (10, 5)
+
+
+async def test_session_history_filtered_by_session_id():
+    store = _store()
+
+    await store.get_session_history(limit=10, offset=5, session_id="sess-1")
+
+    sql = _normalized_sql(store)
+    assert "WHERE session_id = $1 ORDER BY started_at DESC LIMIT $2 OFFSET $3" in sql
+    assert store.pool.fetch.await_args.args[1:] == ("sess-1", 10, 5)
+
+
+async def test_session_history_empty_session_id_still_filters():
+    """An empty id matches no session; it must not fall back to every session."""
+    store = _store()
+
+    await store.get_session_history(session_id="")
+
+    assert "WHERE session_id = $1" in _normalized_sql(store)
+    assert store.pool.fetch.await_args.args[1] == ""